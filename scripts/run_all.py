@@ -6,19 +6,20 @@ Just run this script; stop the UI with Ctrl+C when you've chosen all titles.
 
 from __future__ import annotations
 
+import functools
+import os
+import subprocess
 import sys
 import threading
 import time
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT / "src"))
+from yt_agent_assistant.config import load_settings
+from yt_agent_assistant.web_app import create_app, resolve_inflight, serve_app, sync_signal
+from yt_agent_assistant.services.images import ImageRepository
+from yt_agent_assistant.utils import extract_index_from_name
 
-from yt_agent_assistant.config import load_settings  # noqa: E402
-from yt_agent_assistant.web_app import create_app  # noqa: E402
-from yt_agent_assistant.services.resolve import sync_timelines  # noqa: E402
-from yt_agent_assistant.services.images import ImageRepository  # noqa: E402
-from yt_agent_assistant.utils import extract_index_from_name  # noqa: E402
+ROOT = Path(__file__).resolve().parents[1]
 
 
 def main():
@@ -31,7 +32,7 @@ def main():
     app_flask = create_app(settings, config_path=config_path)
 
     def _serve():
-        app_flask.run(host="127.0.0.1", port=5050, debug=settings.flask.debug, use_reloader=False)
+        serve_app(app_flask, settings, host="127.0.0.1", port=5050)
 
     srv_thread = threading.Thread(target=_serve, daemon=True)
     srv_thread.start()
@@ -40,36 +41,114 @@ def main():
 
     repo = ImageRepository(settings)
 
-    def all_tracks_ready() -> bool:
-        imgs = repo.list_images()
-        if not imgs:
+    # Images whose chosen.txt/trackXX already passed, keyed on both mtimes so a
+    # regressed image is re-checked instead of trusted forever.
+    _ready_cache: dict[Path, tuple[int, int]] = {}
+    _images_cache: dict[str, object] = {"mtime_ns": None, "imgs": []}
+
+    _subdir_for_image = functools.lru_cache(maxsize=256)(repo.subdir_for_image)
+
+    def _list_images_cached() -> list[Path]:
+        try:
+            mtime_ns = os.stat(repo.image_dir).st_mtime_ns
+        except OSError:
+            return []
+        if _images_cache["mtime_ns"] != mtime_ns:
+            _images_cache["imgs"] = repo.list_images()
+            _images_cache["mtime_ns"] = mtime_ns
+        return _images_cache["imgs"]
+
+    def _image_ready(img: Path) -> bool:
+        directory = _subdir_for_image(img)
+        chosen = directory / "chosen.txt"
+        idx = extract_index_from_name(img.name) or 0
+        track_dir = repo.track_root / f"track{idx:02d}"
+        try:
+            chosen_st = chosen.stat()
+            stamp = (chosen_st.st_mtime_ns, track_dir.stat().st_mtime_ns)
+        except OSError:
             return False
-        for img in imgs:
-            directory = repo.subdir_for_image(img)
-            chosen = directory / "chosen.txt"
-            if not chosen.exists() or not chosen.read_text(encoding="utf-8").strip():
-                return False
-            idx = extract_index_from_name(img.name) or 0
-            track_dir = repo.track_root / f"track{idx:02d}"
-            if not track_dir.exists():
-                return False
-            mp3s = list(track_dir.glob("*.mp3"))
-            if not mp3s:
+        if _ready_cache.get(img) == stamp:
+            return True
+        if chosen_st.st_size == 0:
+            return False
+        # Tiny files may be whitespace-only; only then pay the full read.
+        if chosen_st.st_size < 8 and not chosen.read_text(encoding="utf-8").strip():
+            return False
+        with os.scandir(track_dir) as entries:
+            if not any(e.name.endswith(".mp3") and e.is_file(follow_symlinks=False) for e in entries):
                 return False
+        _ready_cache[img] = stamp
         return True
 
+    def all_tracks_ready() -> bool:
+        imgs = _list_images_cached()
+        if not imgs:
+            return False
+        return all(_image_ready(img) for img in imgs)
+
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+
+    # One shared event: Flask handlers set it directly when tracks change,
+    # the watchdog observer sets it for out-of-band filesystem changes.
+    wake = sync_signal
+
+    class _TrackAssetHandler(FileSystemEventHandler):
+        def on_created(self, event):
+            self._maybe_wake(event.src_path)
+
+        def on_modified(self, event):
+            self._maybe_wake(event.src_path)
+
+        def on_moved(self, event):
+            self._maybe_wake(event.dest_path)
+
+        @staticmethod
+        def _maybe_wake(path: str) -> None:
+            if path.endswith("chosen.txt") or path.endswith(".mp3"):
+                wake.set()
+
+    observer = Observer()
+    handler = _TrackAssetHandler()
+    for watched in {repo.output_dir, repo.track_root}:
+        watched.mkdir(parents=True, exist_ok=True)
+        observer.schedule(handler, str(watched), recursive=True)
+    observer.start()
+
+    last_check_ts = 0.0
     try:
         while True:
-            time.sleep(5)
+            # Event-driven wakeup; the timeout is only a safety net for missed events.
+            wake.wait(timeout=30)
+            # Coalesce bursts (one wake per image batch, not per file), and
+            # keep a minimum interval between full readiness scans.
+            time.sleep(max(2.0, 5.0 - (time.monotonic() - last_check_ts)))
+            wake.clear()
+            last_check_ts = time.monotonic()
             if all_tracks_ready():
                 print("Tracks prêts pour toutes les images. Lancement de la synchro Resolve...")
                 break
     except KeyboardInterrupt:
         print("Arrêt manuel demandé.")
+    finally:
+        observer.stop()
+        observer.join()
     # Pas d'arrêt forcé du serveur Flask ici (daemon thread s'arrêtera quand le script se termine).
 
-    print("Synchronisation des timelines Resolve...")
-    sync_timelines(settings, only_indices=None)
+    if not resolve_inflight.acquire(blocking=False):
+        print("Une synchro Resolve est déjà en cours (déclenchée par l'UI); pas de second lancement.")
+    else:
+        print("Synchronisation des timelines Resolve...")
+        try:
+            # Run the sync in its own process so the Flask thread keeps the
+            # GIL to itself while Resolve churns.
+            subprocess.run(
+                [sys.executable, str(ROOT / "scripts" / "update_resolve.py"), "--config", str(config_path)],
+                check=False,
+            )
+        finally:
+            resolve_inflight.release()
     print("Terminé.")
 
 
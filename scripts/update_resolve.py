@@ -6,14 +6,10 @@ Sync generated thumbnails and audio tracks into DaVinci Resolve timelines.
 from __future__ import annotations
 
 import argparse
-import sys
 from pathlib import Path
 
-ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(ROOT / "src"))
-
-from yt_agent_assistant.config import load_settings  # noqa: E402
-from yt_agent_assistant.services.resolve import sync_timelines  # noqa: E402
+from yt_agent_assistant.config import load_settings
+from yt_agent_assistant.services.resolve import sync_timelines
 
 
 def main():
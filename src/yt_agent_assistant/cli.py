@@ -5,14 +5,11 @@ from typing import List, Optional
 
 import typer
 from rich.console import Console
-from rich.table import Table
 
 from .config import EXAMPLE_CONFIG_PATH, DEFAULT_CONFIG_PATH, Settings, dump_settings, load_settings
-from .services.audio import AudioEngine
-from .services.images import ImageRepository, human_mb
-from .services.titles import TitleService, write_refs_lists
-from .services.resolve import sync_timelines
-from .web_app import create_app
+
+# Service modules (openai, PIL, flask, ...) are imported lazily inside each
+# command so lightweight invocations don't pay the full import graph.
 
 console = Console()
 app = typer.Typer(help="YouTube vibes assistant CLI", no_args_is_help=True)
@@ -51,43 +48,69 @@ def generate_titles(
     output: Optional[Path] = typer.Option(None, "--output", "-o", help="Output txt file path."),
     write_refs: bool = typer.Option(False, "--refs", help="Also write scripture reference lists."),
 ):
+    import asyncio
+
+    from rich.table import Table
+
+    from .services.images import ImageRepository
+    from .services.titles import TitleService, write_refs_lists
+
     settings = _load_settings(config)
     repo = ImageRepository(settings)
     repo.ensure_dirs()
     service = TitleService(settings)
 
-    if mode.lower() == "style":
-        titles = service.style_titles(image)
-    elif mode.lower() == "devotional":
-        titles = service.devotional_titles(image)
-    elif mode.lower() == "click":
-        titles = service.click_titles(image)
-    elif mode.lower() == "guided":
-        if not instruction.strip():
-            typer.echo("Guided mode requires --instruction text.")
-            raise typer.Exit(code=1)
-        titles = service.guided_titles(image, instruction)
-    else:
+    mode_l = mode.lower()
+    if mode_l == "guided" and not instruction.strip():
+        typer.echo("Guided mode requires --instruction text.")
+        raise typer.Exit(code=1)
+    if mode_l not in ("style", "devotional", "click", "guided"):
         typer.echo("Unknown mode. Use one of: style, devotional, click, guided.")
         raise typer.Exit(code=1)
 
     dest_dir = output.parent if output else repo.subdir_for_image(image)
     dest_dir.mkdir(parents=True, exist_ok=True)
-    dest = output or (dest_dir / f"titles_{mode.lower()}.txt")
-    dest.write_text("\n".join(titles), encoding="utf-8")
-
-    table = Table(title="Generated titles")
-    table.add_column("#", justify="right")
-    table.add_column("Title")
-    for idx, t in enumerate(titles, start=1):
-        table.add_row(str(idx), t)
-    console.print(table)
-    console.print(f"[bold green]Saved[/bold green] -> {dest}")
-
-    if write_refs and titles:
-        gospels, psalms, combined = service.best_references(image, titles[0])
-        write_refs_lists(dest_dir, gospels, psalms, combined)
-        console.print(f"[bold blue]Refs written[/bold blue] -> {dest_dir}")
+    dest = output or (dest_dir / f"titles_{mode_l}.txt")
+
+    async def _run():
+        if mode_l == "style":
+            titles = await service.style_titles_async(image)
+        elif mode_l == "devotional":
+            titles = await service.devotional_titles_async(image)
+        elif mode_l == "click":
+            titles = await service.click_titles_async(image)
+        else:
+            titles = await service.guided_titles_async(image, instruction)
+
+        # Fire the reference lookup as soon as a top candidate exists; the
+        # file write and table rendering below overlap with its round trip.
+        refs_task = (
+            asyncio.create_task(service.best_references_async(image, titles[0]))
+            if write_refs and titles
+            else None
+        )
+        if refs_task is not None:
+            # Yield once so the task runs up to its first await and the HTTP
+            # request is actually dispatched before the synchronous output
+            # below blocks the loop.
+            await asyncio.sleep(0)
+
+        await asyncio.to_thread(dest.write_text, "\n".join(titles), encoding="utf-8")
+
+        table = Table(title="Generated titles")
+        table.add_column("#", justify="right")
+        table.add_column("Title")
+        for idx, t in enumerate(titles, start=1):
+            table.add_row(str(idx), t)
+        await asyncio.to_thread(console.print, table)
+        console.print(f"[bold green]Saved[/bold green] -> {dest}")
+
+        if refs_task is not None:
+            gospels, psalms, combined = await refs_task
+            write_refs_lists(dest_dir, gospels, psalms, combined)
+            console.print(f"[bold blue]Refs written[/bold blue] -> {dest_dir}")
+
+    asyncio.run(_run())
 
 
 @titles_app.command("refs")
@@ -97,6 +120,9 @@ def refs(
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="YAML config path."),
     output_dir: Optional[Path] = typer.Option(None, "--output", "-o", help="Directory for ref files."),
 ):
+    from .services.images import ImageRepository
+    from .services.titles import TitleService, write_refs_lists
+
     settings = _load_settings(config)
     repo = ImageRepository(settings)
     repo.ensure_dirs()
@@ -118,6 +144,11 @@ def build_audio(
     head: List[str] = typer.Option([], "--head", "-h", help="Preferred psalm numbers or gospel refs."),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="YAML config path."),
 ):
+    from rich.table import Table
+
+    from .services.audio import AudioEngine
+    from .services.images import ImageRepository
+
     settings = _load_settings(config)
     repo = ImageRepository(settings)
     repo.ensure_dirs()
@@ -145,6 +176,8 @@ app.add_typer(images_app, name="images")
 def import_images(
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="YAML config path."),
 ):
+    from .services.images import ImageRepository
+
     settings = _load_settings(config)
     repo = ImageRepository(settings)
     repo.ensure_dirs()
@@ -156,6 +189,8 @@ def make_thumb(
     image: Path = typer.Argument(..., exists=True, help="Image to compress for YouTube."),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="YAML config path."),
 ):
+    from .services.images import ImageRepository, human_mb
+
     settings = _load_settings(config)
     repo = ImageRepository(settings)
     repo.ensure_dirs()
@@ -170,6 +205,8 @@ def make_thumb(
 def reset_outputs(
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="YAML config path."),
 ):
+    from .services.images import ImageRepository
+
     settings = _load_settings(config)
     repo = ImageRepository(settings)
     repo.hard_reset_state()
@@ -185,6 +222,8 @@ def resolve_sync(
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="YAML config path."),
     only: List[int] = typer.Option([], "--only", "-o", help="Timeline indices to sync (repeatable)."),
 ):
+    from .services.resolve import sync_timelines
+
     settings = _load_settings(config)
     only_indices = [int(x) for x in only] if only else None
     sync_timelines(settings, only_indices=only_indices)
@@ -192,13 +231,15 @@ def resolve_sync(
 
 @app.command("ui")
 def ui(
-    host: str = typer.Option("0.0.0.0", "--host", help="Flask host."),
+    host: str = typer.Option("127.0.0.1", "--host", help="Flask host."),
     port: int = typer.Option(5050, "--port", help="Flask port."),
     config: Optional[Path] = typer.Option(None, "--config", "-c", help="YAML config path."),
 ):
+    from .web_app import create_app, serve_app
+
     settings = _load_settings(config)
     app_flask = create_app(settings, config_path=config)
-    app_flask.run(host=host, port=port, debug=settings.flask.debug)
+    serve_app(app_flask, settings, host=host, port=port)
 
 
 def main():
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, fields, is_dataclass
+from dataclasses import dataclass, field, fields
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Any, Dict, Iterable, Optional, Sequence
 
@@ -11,6 +12,11 @@ try:
 except ImportError as exc:  # pragma: no cover
     raise RuntimeError("PyYAML is required to load configuration files.") from exc
 
+try:
+    from yaml import CSafeDumper as _YamlDumper, CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in
+    from yaml import SafeDumper as _YamlDumper, SafeLoader as _YamlLoader
+
 
 @dataclass
 class CoreSettings:
@@ -18,7 +24,7 @@ class CoreSettings:
     final_duration_tc: str = "3:33:32:20"
     trim_first_audio_seconds: float = 3.2
 
-    @property
+    @cached_property
     def target_seconds(self) -> float:
         frames = tc_to_frames(self.final_duration_tc, self.fps)
         return frames_to_seconds(frames, self.fps)
@@ -79,16 +85,25 @@ class AudioSettings:
 @dataclass
 class OpenAISettings:
     model: str = "gpt-4.1"
+    # Short creative outputs don't need the flagship tier; titles default to
+    # a small fast model while references stay on the generic one.
+    titles_model: Optional[str] = "gpt-4o-mini"
+    refs_model: Optional[str] = None
     title_examples_input: str = ""
     devotional_examples_input: str = ""
     default_guide_hint: Optional[str] = None
 
+    def __post_init__(self) -> None:
+        self.titles_model = self.titles_model or self.model
+        self.refs_model = self.refs_model or self.model
+
 
 @dataclass
 class FlaskSettings:
     debug: bool = True
     secret_key: str = "dev-key"
     reset_on_start: bool = True
+    static_cache_seconds: int = 3600
 
 
 @dataclass
@@ -141,8 +156,9 @@ class Settings:
 
     def to_dict(self) -> Dict[str, Any]:
         def _serialize(obj: Any) -> Any:
-            if is_dataclass(obj):
-                return {f.name: _serialize(getattr(obj, f.name)) for f in fields(obj)}
+            field_names = _FIELD_NAMES.get(type(obj))
+            if field_names is not None:
+                return {name: _serialize(getattr(obj, name)) for name in field_names}
             if isinstance(obj, Path):
                 return str(obj)
             if isinstance(obj, tuple):
@@ -152,22 +168,47 @@ class Settings:
         return _serialize(self)
 
 
+# Field lists introspected once at import time; to_dict walks these instead of
+# calling is_dataclass()/fields() per node.
+_FIELD_NAMES = {
+    cls: tuple(f.name for f in fields(cls))
+    for cls in (
+        CoreSettings,
+        PathSettings,
+        ImageSettings,
+        AudioSettings,
+        OpenAISettings,
+        FlaskSettings,
+        ResolveSettings,
+        Settings,
+    )
+}
+
+
 DEFAULT_CONFIG_PATH = Path(__file__).resolve().parents[2] / "configs" / "settings.yaml"
 EXAMPLE_CONFIG_PATH = Path(__file__).resolve().parents[2] / "configs" / "settings.example.yaml"
 
 
+@lru_cache(maxsize=8)
+def _read_yaml(path: Path, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    # mtime_ns is part of the key so edits to the file invalidate the cache.
+    return yaml.load(path.read_text(encoding="utf-8"), Loader=_YamlLoader)
+
+
 def load_settings(config_path: Optional[str | Path] = None) -> Settings:
     path = Path(config_path) if config_path else DEFAULT_CONFIG_PATH
     if not path.exists():
         fallback = EXAMPLE_CONFIG_PATH if EXAMPLE_CONFIG_PATH.exists() else None
         if fallback:
-            data = yaml.safe_load(fallback.read_text(encoding="utf-8"))
+            data = _read_yaml(fallback, fallback.stat().st_mtime_ns)
         else:
             data = None
     else:
-        data = yaml.safe_load(path.read_text(encoding="utf-8"))
+        data = _read_yaml(path, path.stat().st_mtime_ns)
     return Settings.from_dict(data)
 
 
 def dump_settings(settings: Settings, destination: Path) -> None:
-    destination.write_text(yaml.safe_dump(settings.to_dict(), sort_keys=False), encoding="utf-8")
+    destination.write_text(
+        yaml.dump(settings.to_dict(), Dumper=_YamlDumper, sort_keys=False), encoding="utf-8"
+    )
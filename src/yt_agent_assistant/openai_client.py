@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+
+from openai import AsyncOpenAI
+
+try:
+    import httpx2 as httpx  # OpenAI SDK >= 2.x runs on the httpx2 fork
+except ImportError:  # pragma: no cover - older SDKs ship classic httpx
+    import httpx
+
+# One client per event loop: connections keep-alive across calls (no TLS
+# handshake per request), and the pool is wide enough that concurrent
+# requests don't queue on a connection slot. Keyed weakly on the loop
+# because httpx transports die with the loop that created them: async
+# callers running their own loops each get a matching client, while sync
+# callers all funnel through the single background loop below and so
+# share one client for the life of the process.
+_CLIENTS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def get_client() -> AsyncOpenAI:
+    loop = asyncio.get_running_loop()
+    client = _CLIENTS.get(loop)
+    if client is None:
+        client = AsyncOpenAI(
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60,
+                ),
+                timeout=httpx.Timeout(60.0, connect=5.0),
+            )
+        )
+        _CLIENTS[loop] = client
+    return client
+
+
+# Long-lived loop for sync callers. asyncio.run would spin up a fresh loop
+# (and therefore a fresh client and connection pool) per call; routing every
+# sync wrapper through this one background loop keeps a single client whose
+# keep-alive connections actually get reused.
+_SYNC_LOOP: asyncio.AbstractEventLoop | None = None
+_SYNC_LOOP_LOCK = threading.Lock()
+
+
+def _sync_loop() -> asyncio.AbstractEventLoop:
+    global _SYNC_LOOP
+    with _SYNC_LOOP_LOCK:
+        if _SYNC_LOOP is None or _SYNC_LOOP.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="openai-sync-loop", daemon=True
+            ).start()
+            _SYNC_LOOP = loop
+        return _SYNC_LOOP
+
+
+def run_sync(coro):
+    """Run a coroutine on the shared background loop and return its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _sync_loop()).result()
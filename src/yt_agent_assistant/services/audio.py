@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+import io
+import json
+import os
 import random
 import re
 import shutil
 import subprocess
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
+from itertools import accumulate
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple, Union
@@ -11,11 +17,24 @@ from typing import Dict, List, Optional, Sequence, Tuple, Union
 from ..config import Settings
 from ..utils import coerce_iterable_str, format_ts
 
-_PSALM_RE = re.compile(r"(?i)psalm[\s_\-]*0*([0-9]+)")
-_GOSPEL_RE = re.compile(r"(?i)\b(luke|luc|matt(?:hew|hieu)?|john|jean|marc|mark)\b[\s_\-]*0*([0-9]+)")
+# re.ASCII skips the Unicode casefold tables; filenames here are ASCII.
+_PSALM_RE = re.compile(r"psalm[\s_\-]*0*([0-9]+)", re.IGNORECASE | re.ASCII)
+_GOSPEL_RE = re.compile(
+    r"\b(luke|luc|matt(?:hew|hieu)?|john|jean|marc|mark)\b[\s_\-]*0*([0-9]+)",
+    re.IGNORECASE | re.ASCII,
+)
 
 
-TrackItem = Dict[str, Union[str, int, Path, float, None]]
+@dataclass(slots=True)
+class TrackItem:
+    path: Path
+    type: str
+    psalm_num: Optional[int]
+    gospel_name: Optional[str]
+    gospel_chapter: Optional[int]
+    has_num: bool
+    label: str
+    dur: float
 
 
 @dataclass
@@ -34,35 +53,42 @@ class AudioEngine:
 
     def __init__(self, settings: Settings):
         self.settings = settings
+        self._duration_cache: Optional[Dict[str, list]] = None
 
     # ---- collectors -------------------------------------------------
     def collect_psalms(self) -> List[TrackItem]:
         src = self.settings.paths.trimmed_dir
         if not src.exists():
             raise SystemExit(f"[ERROR] Missing psalm directory: {src}")
-        files = sorted([p for p in src.glob("*.mp3") if p.is_file()])
+        with os.scandir(src) as entries:
+            files = sorted(
+                Path(e.path)
+                for e in entries
+                if e.name.lower().endswith(".mp3") and e.is_file(follow_symlinks=False)
+            )
         if not files:
             raise SystemExit(f"[ERROR] No MP3 found in: {src}")
 
+        durations = self._probe_durations(files)
         items: List[TrackItem] = []
         for mp3 in files:
             num, ok = self._parse_psalm_number(mp3)
-            dur = self.ffprobe_duration_seconds(mp3)
+            dur = durations[mp3]
             if dur <= 0.0:
                 print(f"[WARN] Duration unreadable: {mp3.name} (skip)")
                 continue
             label = f"psalm {num}" if ok and num is not None else mp3.stem
             items.append(
-                {
-                    "path": mp3,
-                    "type": "psalm",
-                    "psalm_num": num if ok else None,
-                    "gospel_name": None,
-                    "gospel_chapter": None,
-                    "has_num": ok,
-                    "label": label,
-                    "dur": dur,
-                }
+                TrackItem(
+                    path=mp3,
+                    type="psalm",
+                    psalm_num=num if ok else None,
+                    gospel_name=None,
+                    gospel_chapter=None,
+                    has_num=ok,
+                    label=label,
+                    dur=dur,
+                )
             )
         if not items:
             raise SystemExit("[ERROR] No usable psalms.")
@@ -73,10 +99,19 @@ class AudioEngine:
         if not root.exists():
             print(f"[INFO] Gospel folder missing: {root} (ignored)")
             return []
-        items: List[TrackItem] = []
-        for mp3 in sorted(root.glob("*/*.mp3")):
-            if not mp3.is_file():
-                continue
+        candidates: List[Path] = []
+        with os.scandir(root) as subdirs:
+            for sub in subdirs:
+                if not sub.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(sub.path) as entries:
+                    candidates.extend(
+                        Path(e.path)
+                        for e in entries
+                        if e.name.lower().endswith(".mp3") and e.is_file(follow_symlinks=False)
+                    )
+        recognized: List[Tuple[Path, str, int]] = []
+        for mp3 in sorted(candidates):
             parent = mp3.parent.name
             name_infer, ch_infer = self._parse_gospel_ref(mp3.stem)
             if not name_infer:
@@ -85,25 +120,86 @@ class AudioEngine:
             if not name_infer or not ch_infer:
                 print(f"[WARN] Gospel ref not recognized: {mp3}")
                 continue
-            dur = self.ffprobe_duration_seconds(mp3)
+            recognized.append((mp3, name_infer, ch_infer))
+
+        durations = self._probe_durations([mp3 for mp3, _, _ in recognized])
+        items: List[TrackItem] = []
+        for mp3, name_infer, ch_infer in recognized:
+            dur = durations[mp3]
             if dur <= 0.0:
                 print(f"[WARN] Duration unreadable (gospel): {mp3.name} (skip)")
                 continue
             disp = f"{self._display_gospel_name(name_infer)} {ch_infer}"
             items.append(
-                {
-                    "path": mp3,
-                    "type": "gospel",
-                    "psalm_num": None,
-                    "gospel_name": name_infer,
-                    "gospel_chapter": ch_infer,
-                    "has_num": True,
-                    "label": disp,
-                    "dur": dur,
-                }
+                TrackItem(
+                    path=mp3,
+                    type="gospel",
+                    psalm_num=None,
+                    gospel_name=name_infer,
+                    gospel_chapter=ch_infer,
+                    has_num=True,
+                    label=disp,
+                    dur=dur,
+                )
             )
         return items
 
+    @property
+    def _duration_cache_path(self) -> Path:
+        return self.settings.paths.track_root / ".duration_cache.json"
+
+    def _load_duration_cache(self) -> Dict[str, list]:
+        if self._duration_cache is None:
+            try:
+                self._duration_cache = json.loads(self._duration_cache_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._duration_cache = {}
+        return self._duration_cache
+
+    def _flush_duration_cache(self) -> None:
+        if self._duration_cache is None:
+            return
+        try:
+            self._duration_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._duration_cache_path.write_text(json.dumps(self._duration_cache), encoding="utf-8")
+        except OSError:
+            pass
+
+    def _probe_durations(self, paths: Sequence[Path]) -> Dict[Path, float]:
+        """
+        Probe many files concurrently; ffprobe is I/O-bound so threads overlap well.
+        Durations persist in a sidecar JSON keyed by mtime/size so warm runs skip
+        the subprocess entirely.
+        """
+        if not paths:
+            return {}
+        cache = self._load_duration_cache()
+        out: Dict[Path, float] = {}
+        misses: List[Tuple[Path, str]] = []
+        for path in paths:
+            try:
+                st = os.stat(path)
+            except OSError:
+                out[path] = 0.0
+                continue
+            key = f"{st.st_mtime_ns}:{st.st_size}"
+            entry = cache.get(str(path))
+            if entry and entry[0] == key:
+                out[path] = float(entry[1])
+            else:
+                misses.append((path, key))
+
+        if misses:
+            workers = min(len(misses), (os.cpu_count() or 4) * 2)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                durations = pool.map(self.duration_seconds, (p for p, _ in misses))
+            for (path, key), dur in zip(misses, durations):
+                out[path] = dur
+                if dur > 0.0:
+                    cache[str(path)] = [key, dur]
+            self._flush_duration_cache()
+        return out
+
     # ---- selection --------------------------------------------------
     def build_selection(
         self,
@@ -119,14 +215,18 @@ class AudioEngine:
         used_paths = set()
         preferred_candidates = preferred_candidates if preferred_candidates is not None else pool_items
 
-        by_psalm: Dict[int, TrackItem] = {}
-        by_gospel: Dict[Tuple[str, int], TrackItem] = {}
-        for item in preferred_candidates:
-            if item["type"] == "psalm" and item["psalm_num"] is not None:
-                by_psalm.setdefault(int(item["psalm_num"]), item)
-            elif item["type"] == "gospel" and item["gospel_name"] and item["gospel_chapter"] is not None:
-                key = (str(item["gospel_name"]), int(item["gospel_chapter"]))
-                by_gospel.setdefault(key, item)
+        # Built in reverse so the first candidate wins, without a setdefault
+        # call (and its hash of an already-present key) per item.
+        by_psalm: Dict[int, TrackItem] = {
+            item.psalm_num: item
+            for item in reversed(preferred_candidates)
+            if item.type == "psalm" and item.psalm_num is not None
+        }
+        by_gospel: Dict[Tuple[str, int], TrackItem] = {
+            (item.gospel_name, item.gospel_chapter): item
+            for item in reversed(preferred_candidates)
+            if item.type == "gospel" and item.gospel_name and item.gospel_chapter is not None
+        }
 
         head: List[TrackItem] = []
         if preferred_head:
@@ -136,50 +236,52 @@ class AudioEngine:
             if isinstance(max_head, int) and max_head > 0:
                 head_candidates = head_candidates[:max_head]
 
-            for pref in head_candidates:
-                if isinstance(pref, int):
-                    cand = by_psalm.get(pref)
-                    if cand and cand["path"] not in used_paths:
-                        head.append(cand)
-                        used_paths.add(cand["path"])
-                elif isinstance(pref, str):
-                    gname, chap = self._parse_gospel_ref(pref)
-                    if gname and chap:
-                        cand = by_gospel.get((gname, chap))
-                        if cand and cand["path"] not in used_paths:
-                            head.append(cand)
-                            used_paths.add(cand["path"])
-
-        tail = [item for item in pool_items if item["path"] not in used_paths]
+            # Bucket by type once, resolve against the lookup tables, then do
+            # a single uniform pass instead of branching per entry.
+            parsed_refs = (
+                self._parse_gospel_ref(p) for p in head_candidates if isinstance(p, str)
+            )
+            resolved = [by_psalm.get(p) for p in head_candidates if isinstance(p, int)]
+            resolved += [by_gospel.get((g, c)) for g, c in parsed_refs if g and c]
+            for cand in resolved:
+                if cand and cand.path not in used_paths:
+                    head.append(cand)
+                    used_paths.add(cand.path)
+
+        tail = [item for item in pool_items if item.path not in used_paths]
         rng.shuffle(tail)
         first_pass = head + tail
 
-        for item in first_pass:
-            selection.append(item)
-            used_paths.add(item["path"])
-            total += float(item["dur"])
-            if total >= target_seconds:
-                return selection, total
-
-        def cycle_once():
-            nonlocal total, used_paths
-            remaining = [it for it in pool_items if it["path"] not in used_paths]
-            if not remaining:
-                used_paths = set()
-                remaining = list(pool_items)
-            rng.shuffle(remaining)
-            for item in remaining:
-                selection.append(item)
-                used_paths.add(item["path"])
-                total += float(item["dur"])
-                if total >= target_seconds:
-                    return True
-            return False
-
-        while total < target_seconds:
-            if cycle_once():
-                break
-        return selection, total
+        # Cumulative durations in C (itertools.accumulate) plus a bisect find
+        # the cut point without a Python-level float add per track.
+        cum = list(accumulate(float(it.dur) for it in first_pass))
+        if cum and cum[-1] >= target_seconds:
+            cut = bisect_left(cum, target_seconds) + 1
+            return first_pass[:cut], cum[cut - 1]
+        selection = first_pass
+        total = cum[-1] if cum else 0.0
+
+        # The first pass consumed the whole pool, so every later cycle is a
+        # fresh shuffled permutation; whole cycles can be appended in bulk
+        # without per-item target checks or used_paths bookkeeping.
+        pool_total = sum(float(it.dur) for it in pool_items)
+        if pool_total <= 0.0:
+            return selection, total
+
+        while total + pool_total < target_seconds:
+            cycle = list(pool_items)
+            rng.shuffle(cycle)
+            selection.extend(cycle)
+            total += pool_total
+
+        final_cycle = list(pool_items)
+        rng.shuffle(final_cycle)
+        cum = list(accumulate(float(it.dur) for it in final_cycle))
+        cut = bisect_left(cum, target_seconds - total)
+        if cut >= len(cum):  # float summation-order slack
+            cut = len(cum) - 1
+        selection.extend(final_cycle[: cut + 1])
+        return selection, total + cum[cut]
 
     # ---- export ----------------------------------------------------
     @staticmethod
@@ -193,24 +295,37 @@ class AudioEngine:
         pad = max(2, len(str(len(selection))))
         out = []
         for idx, item in enumerate(selection, start=1):
-            src = Path(item["path"])
+            src = Path(item.path)
             dst = track_dir / f"{str(idx).zfill(pad)}_{str(timeline_idx).zfill(2)}_{src.name}"
-            shutil.copy2(src, dst)
-            out.append((dst, float(item["dur"]), str(item["label"])))
+            try:
+                # Hardlink instead of copying: the sources are read-only
+                # inputs, so this writes an inode entry, not the audio bytes.
+                os.link(src, dst)
+            except OSError:
+                # Cross-device or unsupported filesystem: fall back to a copy.
+                shutil.copy2(src, dst)
+            out.append((dst, float(item.dur), str(item.label)))
         return out
 
     @staticmethod
     def write_chapters(chapters_path: Path, tracks_with_meta, offset_first=0.0):
-        lines = []
+        # Build the whole file in one StringIO buffer; per-line f-strings plus
+        # a final join would allocate an intermediate string per chapter.
+        buf = io.StringIO()
+        write = buf.write
         t = 0.0
         offset_first = max(0.0, offset_first or 0.0)
         for idx, (_, dur, label) in enumerate(tracks_with_meta, start=1):
-            lines.append(f"{format_ts(t)} - {label}")
+            if idx > 1:
+                write("\n")
+            write(format_ts(t))
+            write(" - ")
+            write(label)
             effective = dur
             if idx == 1 and offset_first > 0.0:
                 effective = max(0.0, dur - offset_first)
             t += effective
-        chapters_path.write_text("\n".join(lines), encoding="utf-8")
+        chapters_path.write_text(buf.getvalue(), encoding="utf-8")
 
     # ---- orchestrator -------------------------------------------------
     def build_playlist(
@@ -252,6 +367,22 @@ class AudioEngine:
         )
 
     # ---- helpers ----------------------------------------------------
+    @staticmethod
+    def duration_seconds(path: Path) -> float:
+        """
+        Read the duration from the MP3 header in-process (no fork); fall back
+        to ffprobe for files mutagen cannot parse.
+        """
+        try:
+            from mutagen.mp3 import MP3
+
+            dur = float(MP3(path).info.length)
+            if dur > 0.0:
+                return dur
+        except Exception:
+            pass
+        return AudioEngine.ffprobe_duration_seconds(path)
+
     @staticmethod
     def ffprobe_duration_seconds(path: Path) -> float:
         cmd = [
@@ -265,14 +396,22 @@ class AudioEngine:
             str(path),
         ]
         try:
-            out = subprocess.check_output(cmd, text=True).strip()
-            return float(out)
+            # float() parses bytes directly; skip the text-mode decode and
+            # silence ffprobe's stderr instead of buffering it.
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True,
+                timeout=5,
+            )
+            return float(result.stdout)
         except Exception:
             return 0.0
 
     @staticmethod
     def _parse_psalm_number(path: Path):
-        match = _PSALM_RE.search(path.stem)
+        match = _PSALM_RE.search(path.name)
         if not match:
             return None, False
         try:
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import io
+import math
+import os
 import re
 import shutil
 from pathlib import Path
@@ -10,6 +12,10 @@ from PIL import Image, ImageOps
 
 from ..config import Settings
 
+_IMG_EXTS = frozenset({"jpg", "jpeg", "png"})
+_IDX_RE = re.compile(r"(\d+)")
+_IM_STEM_RE = re.compile(r"^im(\d+)$", re.I)
+
 
 class ImageRepository:
     """
@@ -59,24 +65,40 @@ class ImageRepository:
                     pass
 
         if self.track_root.exists():
-            for path in self.track_root.iterdir():
-                try:
-                    if path.is_dir() and re.fullmatch(r"track\d{2}", path.name):
-                        shutil.rmtree(path)
-                    elif path.is_file() and re.fullmatch(r"chapters\d{2}\.txt", path.name):
-                        path.unlink()
-                except Exception:
-                    pass
+            # trackNN / chaptersNN.txt are fixed-shape names; plain slicing
+            # beats running the regex engine on every entry.
+            with os.scandir(self.track_root) as entries:
+                for entry in entries:
+                    name = entry.name
+                    try:
+                        if (
+                            entry.is_dir()
+                            and len(name) == 7
+                            and name.startswith("track")
+                            and name[5:].isdigit()
+                        ):
+                            shutil.rmtree(entry.path)
+                        elif (
+                            entry.is_file()
+                            and len(name) == 14
+                            and name.startswith("chapters")
+                            and name.endswith(".txt")
+                            and name[8:10].isdigit()
+                        ):
+                            os.unlink(entry.path)
+                    except Exception:
+                        pass
 
     def list_images(self) -> List[Path]:
-        imgs = [
-            p
-            for p in self.image_dir.iterdir()
-            if p.is_file() and p.suffix.lower() in {".jpg", ".jpeg", ".png"}
-        ]
+        with os.scandir(self.image_dir) as entries:
+            imgs = [
+                Path(entry.path)
+                for entry in entries
+                if entry.is_file() and entry.name.rpartition(".")[2].lower() in _IMG_EXTS
+            ]
 
         def _idx_key(path: Path) -> int:
-            match = re.search(r"(\d+)", path.stem)
+            match = _IDX_RE.search(path.stem)
             return int(match.group(1)) if match else 10**9
 
         imgs.sort(key=lambda p: (_idx_key(p), p.name.lower()))
@@ -109,40 +131,47 @@ class ImageRepository:
                 shutil.copy2(path, dst)
             return dst, orig_bytes, dst.stat().st_size
 
+        if orig_bytes <= target_bytes:
+            # Already under the soft target: zero decode cost, straight copy.
+            return _copy_as_is(img_path)
         if orig_bytes <= max_bytes:
+            # Over target but under the hard cap; still acceptable as-is.
             return _copy_as_is(img_path)
 
         suffix = self.settings.images.yt_thumb_suffix or "_yt"
         target = yt_dir / f"{img_path.stem}{suffix}.jpg"
 
+        # Decode once and reuse the pixels for both the PNG attempt and the
+        # JPEG fallback; a second Image.open would redo the full inflate.
         try:
-            img = Image.open(img_path)
-            if img_path.suffix.lower() == ".png":
-                png_try = ImageOps.exif_transpose(img.copy())
-                png_bytes = self._save_png_optimized(png_try)
+            with Image.open(img_path) as raw:
+                raw = self._maybe_exif_transpose(raw)
+                raw.load()
+        except Exception:
+            return _copy_as_is(img_path)
+
+        if img_path.suffix.lower() == ".png":
+            try:
+                png_bytes = self._save_png_optimized(raw)
                 if len(png_bytes) <= target_bytes:
                     target = yt_dir / f"{img_path.stem}{suffix}.png"
                     target.write_bytes(png_bytes)
                     return target, orig_bytes, len(png_bytes)
-        except Exception:
-            pass
+            except Exception:
+                pass
 
         try:
-            im_jpg = self._ensure_rgb_no_alpha(Image.open(img_path))
-            lo, hi = 50, 95
-            best_data: Optional[bytes] = None
-
-            while lo <= hi:
-                q = (lo + hi) // 2
-                data = self._save_jpeg(im_jpg, q)
-                if len(data) <= target_bytes:
-                    best_data = data
-                    lo = q + 1
-                else:
-                    hi = q - 1
-
-            if best_data is None:
-                best_data = self._save_jpeg(im_jpg, 40)
+            im_jpg = self._ensure_rgb_no_alpha(raw)
+            # Predict the right quality from one cheap probe encode instead of
+            # binary-searching: JPEG size grows roughly with the square of the
+            # quality setting, so one probe at q=80 (no Huffman optimization)
+            # pins down the target quality to within a step or two.
+            probe = self._save_jpeg(im_jpg, 80, optimize=False)
+            q_guess = max(50, min(95, int(80 * math.sqrt(target_bytes / max(1, len(probe))))))
+            best_data = self._save_jpeg(im_jpg, q_guess)
+            while len(best_data) > target_bytes and q_guess > 40:
+                q_guess = max(40, q_guess - 5)
+                best_data = self._save_jpeg(im_jpg, q_guess)
 
             target.write_bytes(best_data)
             return target, orig_bytes, len(best_data)
@@ -162,15 +191,18 @@ class ImageRepository:
             return
         files.sort(key=lambda p: p.stat().st_mtime)
 
-        idx = self._next_im_index()
+        # Track taken indices in memory instead of probing dest.exists() per
+        # candidate; one directory scan replaces N*k stat calls.
+        taken = set(self._existing_im_indices())
+        idx = (max(taken) + 1) if taken else 0
         for src in files:
-            dest = self.image_dir / f"im{idx:02d}.png"
-            while dest.exists():
+            while idx in taken:
                 idx += 1
-                dest = self.image_dir / f"im{idx:02d}.png"
+            taken.add(idx)
+            dest = self.image_dir / f"im{idx:02d}.png"
             try:
                 with Image.open(src) as im:
-                    im = ImageOps.exif_transpose(im)
+                    im = self._maybe_exif_transpose(im)
                     im.save(dest, format="PNG")
             except Exception:
                 continue
@@ -178,19 +210,19 @@ class ImageRepository:
             self._archive_import_source(src)
 
     def _existing_im_indices(self) -> List[int]:
-        pat = re.compile(r"^im(\d+)$", re.I)
         idxs: List[int] = []
         if not self.image_dir.exists():
             return idxs
-        for path in self.image_dir.iterdir():
-            if not path.is_file():
-                continue
-            match = pat.match(path.stem)
-            if match:
-                try:
-                    idxs.append(int(match.group(1)))
-                except ValueError:
+        with os.scandir(self.image_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
                     continue
+                match = _IM_STEM_RE.match(Path(entry.name).stem)
+                if match:
+                    try:
+                        idxs.append(int(match.group(1)))
+                    except ValueError:
+                        continue
         return sorted(idxs)
 
     def _next_im_index(self) -> int:
@@ -201,10 +233,10 @@ class ImageRepository:
         archive = self.settings.paths.imported_archive_dir
         archive.mkdir(parents=True, exist_ok=True)
         dst = archive / src.name
-        counter = 1
-        while dst.exists():
-            dst = archive / f"{src.stem}_{counter}{src.suffix}"
-            counter += 1
+        if dst.exists():
+            # One stat-derived unique suffix instead of probing _1, _2, ...
+            # (plain rename would silently overwrite on POSIX).
+            dst = archive / f"{src.stem}_{src.stat().st_mtime_ns}{src.suffix}"
         try:
             src.rename(dst)
         except Exception:
@@ -213,6 +245,14 @@ class ImageRepository:
             except Exception:
                 pass
 
+    @staticmethod
+    def _maybe_exif_transpose(image: Image.Image) -> Image.Image:
+        # Orientation 1 is the overwhelmingly common case; exif_transpose
+        # would still allocate and copy the full image for it.
+        if image.getexif().get(0x0112, 1) != 1:
+            return ImageOps.exif_transpose(image)
+        return image
+
     @staticmethod
     def _save_png_optimized(image: Image.Image) -> bytes:
         buf = io.BytesIO()
@@ -220,20 +260,21 @@ class ImageRepository:
         return buf.getvalue()
 
     @staticmethod
-    def _save_jpeg(image: Image.Image, quality: int) -> bytes:
+    def _save_jpeg(image: Image.Image, quality: int, optimize: bool = True) -> bytes:
         buf = io.BytesIO()
         image.save(
             buf,
             format="JPEG",
             quality=quality,
-            optimize=True,
+            optimize=optimize,
             progressive=True,
+            subsampling=2,
         )
         return buf.getvalue()
 
     @staticmethod
     def _ensure_rgb_no_alpha(image: Image.Image) -> Image.Image:
-        image = ImageOps.exif_transpose(image)
+        # Caller has already applied exif_transpose on the decoded image.
         if image.mode in ("RGBA", "LA"):
             bg = Image.new("RGB", image.size, (255, 255, 255))
             bg.paste(image, mask=image.split()[-1])
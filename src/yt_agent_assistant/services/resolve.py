@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import glob
 import os
 import re
 import shutil
 import subprocess
 import sys
 import time
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Sequence
 
@@ -15,6 +19,36 @@ from ..utils import tc_to_frames
 
 VIDEO_EXTS = {".mp4", ".mov", ".mkv", ".m4v", ".avi", ".mpg", ".mpeg"}
 
+# Discovery patterns, compiled once at import.
+_RE_IMG_EXT = re.compile(r"\.(png|jpe?g)$", re.I)
+_RE_IMG_IDX = re.compile(r"^im(\d+)\.(png|jpe?g)$", re.I)
+_RE_ANY_DIGITS = re.compile(r"(\d+)")
+_RE_TRAILING_DIGITS = re.compile(r"(\d+)$")
+
+
+@dataclass(slots=True)
+class _Instr:
+    """
+    One AppendToTimeline clip instruction. Slots objects are built during
+    layout and converted to the dict shape the scripting bridge expects only
+    once, at the final call.
+    """
+
+    media_pool_item: object
+    start_frame: int
+    end_frame: int
+    record_frame: int
+    track_index: int = 1
+
+    def as_dict(self) -> dict:
+        return {
+            "mediaPoolItem": self.media_pool_item,
+            "startFrame": self.start_frame,
+            "endFrame": self.end_frame,
+            "recordFrame": self.record_frame,
+            "trackIndex": self.track_index,
+        }
+
 
 def fatal(msg: str) -> None:
     print("[ERROR]", msg)
@@ -25,7 +59,10 @@ def info(msg: str) -> None:
     print("[INFO]", msg)
 
 
+@lru_cache(maxsize=32)
 def require_bin(bin_name: str) -> str:
+    # which() walks $PATH with an os.access per entry; the answer never
+    # changes within a run.
     path = shutil.which(bin_name)
     if not path:
         fatal(f"{bin_name} missing. Install it (e.g. brew install {bin_name}).")
@@ -38,30 +75,90 @@ def _ensure_dir(path):
 
 
 def iter_all_clips_recursive(folder):
-    try:
-        for clip in (folder.GetClipList() or []):
-            yield clip
-        for sub in (folder.GetSubFolderList() or []):
-            yield from iter_all_clips_recursive(sub)
-    except Exception:
-        return
+    # Explicit-stack walk: no recursion depth limit, no nested generator frame
+    # per folder, and a failing sub-bin skips only itself instead of silently
+    # truncating the rest of the traversal.
+    stack = deque([folder])
+    while stack:
+        current = stack.pop()
+        try:
+            clips = current.GetClipList() or []
+            subs = current.GetSubFolderList() or []
+        except Exception:
+            continue
+        yield from clips
+        stack.extend(subs)
+
+
+def _poll_until(predicate, timeout_s, initial_ms=25, max_ms=200):
+    """
+    Call predicate until it returns something truthy or timeout_s elapses.
+    Sleeps with exponential backoff from initial_ms doubling up to max_ms, so
+    fast completions are noticed in ~25 ms without hot-spinning on slow ones.
+    """
+    deadline = time.time() + timeout_s
+    delay = initial_ms / 1000.0
+    cap = max_ms / 1000.0
+    while True:
+        result = predicate()
+        if result:
+            return result
+        if time.time() >= deadline:
+            return None
+        time.sleep(delay)
+        delay = min(cap, delay * 2)
 
 
 def find_media_item_by_path(root_folder, target_abs_path, timeout_s=10, poll_ms=200):
     target_abs_path = os.path.abspath(target_abs_path)
-    start = time.time()
-    while True:
+
+    def _scan():
         for clip in iter_all_clips_recursive(root_folder):
-            file_path = (clip.GetClipProperty("File Path") or "").strip()
+            file_path = _clip_file_path(clip)
             if file_path and os.path.abspath(file_path) == target_abs_path:
                 return clip
-        if (time.time() - start) >= timeout_s:
-            return None
-        time.sleep(poll_ms / 1000.0)
+        return None
+
+    return _poll_until(_scan, timeout_s, max_ms=poll_ms)
+
+
+class MediaPoolIndex:
+    """
+    Cache of {absolute file path: media pool clip}. Enumerating the pool costs
+    one Resolve RPC per clip, so the tree is walked once and refreshed only
+    after imports (or on a miss) instead of re-walked for every lookup.
+    """
+
+    def __init__(self, root_folder):
+        self._root = root_folder
+        self._by_path: dict[str, object] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        for clip in iter_all_clips_recursive(self._root):
+            path = _clip_file_path(clip)
+            if path:
+                self._by_path[os.path.abspath(path)] = clip
+
+    def get(self, path):
+        return self._by_path.get(os.path.abspath(str(path)))
+
+    def get_or_wait(self, path, timeout_s=10, poll_ms=200):
+        target = os.path.abspath(str(path))
+        clip = self._by_path.get(target)
+        if clip:
+            return clip
+
+        def _refresh_and_get():
+            self.refresh()
+            return self._by_path.get(target)
+
+        return _poll_until(_refresh_and_get, timeout_s, max_ms=poll_ms)
 
 
 def apply_render_settings(project, resolve, settings: Settings):
     rs = settings.resolve
+    target_dir = _ensure_dir(rs.render_dir)
     try:
         project.SetCurrentRenderFormatAndCodec(rs.render_format, rs.render_codec)
     except Exception:
@@ -69,7 +166,7 @@ def apply_render_settings(project, resolve, settings: Settings):
 
     payload = {
         "SelectAllFrames": True,
-        "TargetDir": _ensure_dir(rs.render_dir),
+        "TargetDir": target_dir,
         "Format": rs.render_format,
         "VideoCodec": rs.render_codec,
         "ExportVideo": True,
@@ -89,13 +186,16 @@ def apply_render_settings(project, resolve, settings: Settings):
         project.SetRenderSettings(payload)
     except Exception:
         try:
-            project.SetRenderSettings({"TargetDir": _ensure_dir(rs.render_dir)})
+            project.SetRenderSettings({"TargetDir": target_dir})
         except Exception:
             pass
 
 
 def render_all_timelines_with_prefix(project, settings: Settings, only_names=None):
-    prefix = settings.resolve.timeline_prefix
+    rs = settings.resolve
+    prefix = rs.timeline_prefix
+    # One mkdir up front instead of one per render job.
+    target_dir = _ensure_dir(rs.render_dir)
     try:
         count = int(project.GetTimelineCount() or 0)
     except Exception:
@@ -127,7 +227,7 @@ def render_all_timelines_with_prefix(project, settings: Settings, only_names=Non
             project.SetCurrentTimeline(timeline)
         except Exception:
             pass
-        custom = {"TargetDir": _ensure_dir(settings.resolve.render_dir), "CustomName": name}
+        custom = {"TargetDir": target_dir, "CustomName": name}
         try:
             project.SetRenderSettings(custom.copy())
         except Exception:
@@ -149,13 +249,19 @@ def render_all_timelines_with_prefix(project, settings: Settings, only_names=Non
         ok = project.StartRendering()
     info(f"[RENDER] Start: {'OK' if ok else 'FAIL'}")
     if ok:
+        # Poll fast at first so short renders finish promptly, then back off
+        # so long renders don't hammer the scripting API.
+        delay = 0.05
+        grow_at = time.time() + 2.0
         while True:
             try:
                 if not project.IsRenderingInProgress():
                     break
             except Exception:
                 break
-            time.sleep(0.5)
+            time.sleep(delay)
+            if time.time() >= grow_at:
+                delay = min(delay * 1.5, 1.0)
         info("[RENDER] Done.")
 
 
@@ -167,12 +273,73 @@ def probe_duration_seconds(path, ffprobe_bin):
     return float(out.decode().strip())
 
 
-def _is_timeline_item(item) -> bool:
+@lru_cache(maxsize=4096)
+def _probe_cached(path, mtime_ns, ffprobe_bin):
+    return probe_duration_seconds(path, ffprobe_bin)
+
+
+def probe_duration_seconds_cached(path, ffprobe_bin):
+    """
+    Duration probe keyed on (path, mtime) so repeated probes of the same file
+    within a run never spawn a second ffprobe.
+    """
     try:
-        clip_type = item.GetClipProperty("Type") or ""
-        return str(clip_type).strip().lower() == "timeline"
-    except Exception:
-        return False
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _probe_cached(str(path), mtime_ns, ffprobe_bin)
+
+
+def probe_durations_many(paths, ffprobe_bin) -> dict[str, float]:
+    """
+    Probe many files concurrently, keyed by absolute path. ffprobe spends most
+    of its time in process startup and I/O, so threads overlap well; this
+    collapses N serial spawns into ~N/workers wall time.
+    """
+    uniq = sorted({os.path.abspath(str(p)) for p in paths})
+    if not uniq:
+        return {}
+    workers = min(8, os.cpu_count() or 4, len(uniq))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        durations = pool.map(lambda p: probe_duration_seconds_cached(p, ffprobe_bin), uniq)
+    return dict(zip(uniq, durations))
+
+
+_CLIP_PROPS_CACHE: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def _props(clip) -> dict:
+    """
+    Full property dict for a media pool clip, fetched once per clip.
+    GetClipProperty() with no argument is a single RPC returning every
+    property, so File Path / Type / Clip Name reads share one round trip.
+    """
+    try:
+        cached = _CLIP_PROPS_CACHE.get(clip)
+    except TypeError:  # clip proxy not weak-referenceable
+        cached = None
+    if cached is None:
+        try:
+            cached = clip.GetClipProperty() or {}
+        except Exception:
+            cached = {}
+        try:
+            _CLIP_PROPS_CACHE[clip] = cached
+        except TypeError:
+            pass
+    return cached
+
+
+def _invalidate_props_cache() -> None:
+    _CLIP_PROPS_CACHE.clear()
+
+
+def _clip_file_path(clip) -> str:
+    return str(_props(clip).get("File Path") or "").strip()
+
+
+def _is_timeline_item(item) -> bool:
+    return str(_props(item).get("Type") or "").strip().lower() == "timeline"
 
 
 def _get_item_name(item):
@@ -182,23 +349,23 @@ def _get_item_name(item):
             return name
     except Exception:
         pass
-    try:
-        props = item.GetClipProperty() or {}
-        return props.get("Clip Name") or props.get("Name") or ""
-    except Exception:
-        return ""
+    props = _props(item)
+    return props.get("Clip Name") or props.get("Name") or ""
 
 
 def _folder_contains_protected_timeline(folder, protect_names):
-    try:
-        for item in (folder.GetClipList() or []):
+    stack = deque([folder])
+    while stack:
+        current = stack.pop()
+        try:
+            items = current.GetClipList() or []
+            subs = current.GetSubFolderList() or []
+        except Exception:
+            continue
+        for item in items:
             if _is_timeline_item(item) and _get_item_name(item) in protect_names:
                 return True
-        for sub in (folder.GetSubFolderList() or []):
-            if _folder_contains_protected_timeline(sub, protect_names):
-                return True
-    except Exception:
-        pass
+        stack.extend(subs)
     return False
 
 
@@ -223,63 +390,74 @@ def purge_media_pool_except_timelineXX(project, media_pool, settings: Settings,
 
     root = media_pool.GetRootFolder()
 
-    def _purge(folder):
-        clips = list(folder.GetClipList() or [])
-        to_delete = []
-        for clip in clips:
+    # Pass 1: iterative walk collecting everything deletable. Folders holding
+    # a protected timeline are descended into; the rest are deleted wholesale.
+    clips_to_delete = []
+    timelines_to_delete = []
+    folders_to_delete = []
+    stack = deque([root])
+    while stack:
+        folder = stack.popleft()
+        for clip in (folder.GetClipList() or []):
             if _is_timeline_item(clip):
+                if _get_item_name(clip) not in protect:
+                    timelines_to_delete.append(clip)
                 continue
             if keep_paths:
                 try:
-                    p = Path((clip.GetClipProperty("File Path") or "").strip()).resolve()
+                    p = Path(_clip_file_path(clip)).resolve()
                 except Exception:
                     p = None
                 if p and p in keep_paths:
                     continue
-            to_delete.append(clip)
-        if to_delete:
-            try:
-                media_pool.DeleteClips(to_delete)
-            except Exception:
-                for clip in to_delete:
-                    try:
-                        media_pool.DeleteClips([clip])
-                    except Exception:
-                        pass
-
-        timelines_here = [clip for clip in clips if _is_timeline_item(clip)]
-        to_delete_tl = [clip for clip in timelines_here if _get_item_name(clip) not in protect]
-        if to_delete_tl:
-            try:
-                media_pool.DeleteTimelines(to_delete_tl)
-            except Exception:
-                for tl in to_delete_tl:
-                    try:
-                        media_pool.DeleteTimelines([tl])
-                    except Exception:
-                        pass
-
-        subfolders = list(folder.GetSubFolderList() or [])
-        for sub in subfolders:
+            clips_to_delete.append(clip)
+        for sub in (folder.GetSubFolderList() or []):
             if _folder_contains_protected_timeline(sub, protect):
-                _purge(sub)
+                stack.append(sub)
             else:
+                folders_to_delete.append(sub)
+
+    # Pass 2: one bulk RPC per kind, falling back to per-item deletes only
+    # when the bulk call raises.
+    def _bulk_delete(delete_fn, items):
+        if not items:
+            return
+        try:
+            delete_fn(items)
+        except Exception:
+            for item in items:
                 try:
-                    media_pool.DeleteFolders([sub])
+                    delete_fn([item])
                 except Exception:
-                    _purge(sub)
-                    try:
-                        media_pool.DeleteFolders([sub])
-                    except Exception:
-                        pass
+                    pass
 
-    _purge(root)
+    _bulk_delete(media_pool.DeleteClips, clips_to_delete)
+    _bulk_delete(media_pool.DeleteTimelines, timelines_to_delete)
+    _bulk_delete(media_pool.DeleteFolders, folders_to_delete)
+    _invalidate_props_cache()
 
 
 def natural_key(path):
     return os.path.basename(path).lower()
 
 
+def _list_mp3s_sorted(track_dir: Path) -> List[str]:
+    # scandir avoids glob's per-entry fnmatch/stat work; order matches the old
+    # natural_key sort (lowercased basename). Paths come out pre-normalized so
+    # downstream dict keys never re-run abspath.
+    try:
+        with os.scandir(track_dir) as entries:
+            names = [
+                (e.name.lower(), os.path.abspath(e.path))
+                for e in entries
+                if e.is_file(follow_symlinks=False) and e.name.lower().endswith(".mp3")
+            ]
+    except FileNotFoundError:
+        return []
+    names.sort(key=lambda t: t[0])
+    return [path for _, path in names]
+
+
 def ensure_resolve_modules():
     module_dirs = [
         "/Library/Application Support/Blackmagic Design/DaVinci Resolve/Developer/Scripting/Modules/",
@@ -359,8 +537,6 @@ def clear_all_tracks_items(timeline, preserve_video_paths: Optional[set[str]] =
     audio_cnt = _get_track_count_safe(timeline, "audio")
     subtitle_cnt = _get_track_count_safe(timeline, "subtitle")
 
-    deleted = False
-
     def _item_abs_path(item) -> Optional[str]:
         try:
             p = (item.GetClipProperty("File Path") or "").strip()
@@ -370,28 +546,24 @@ def clear_all_tracks_items(timeline, preserve_video_paths: Optional[set[str]] =
             return None
         return None
 
-    preserve_video_paths = {os.path.abspath(p) for p in (preserve_video_paths or set())}
+    preserve = frozenset(os.path.abspath(p) for p in (preserve_video_paths or ()))
+    preserve_video_paths = preserve
 
+    # Collect everything to drop across all tracks, then issue one DeleteClips
+    # RPC instead of one per track.
+    to_drop = []
     for track in range(1, video_cnt + 1):
         items = _items("video", track)
-        to_keep, to_drop = [], []
-        if preserve_video_paths:
-            for it in items:
-                if _item_abs_path(it) in preserve_video_paths:
-                    to_keep.append(it)
-                else:
-                    to_drop.append(it)
+        if preserve:
+            to_drop.extend(it for it in items if _item_abs_path(it) not in preserve)
         else:
-            to_drop = items
-        if _delete(to_drop):
-            deleted = True
+            to_drop.extend(items)
     for track in range(1, audio_cnt + 1):
-        if _delete(_items("audio", track)):
-            deleted = True
+        to_drop.extend(_items("audio", track))
     for track in range(1, subtitle_cnt + 1):
-        if _delete(_items("subtitle", track)):
-            deleted = True
-    if deleted:
+        to_drop.extend(_items("subtitle", track))
+
+    if not to_drop or _delete(to_drop):
         return
 
     for track in range(1, video_cnt + 1):
@@ -416,12 +588,37 @@ def clear_all_tracks_items(timeline, preserve_video_paths: Optional[set[str]] =
                 pass
 
 
-def _parse_hms_to_seconds(text):
-    match = re.search(r"(\d+):(\d+):(\d+)\.(\d+)", text)
-    if not match:
-        return None
-    h, m, s, frac = match.groups()
-    return int(h) * 3600 + int(m) * 60 + int(s) + (int(frac) / (10 ** len(frac)))
+_LIBX264_ARGS = ("-crf", "18", "-preset", "veryfast", "-tune", "stillimage")
+
+# Hardware H.264 encoders in preference order, with still-appropriate quality
+# args. VAAPI is deliberately absent: it needs hwupload/device plumbing that
+# does not compose with the scale+pad filter chain used here.
+_H264_ENCODER_PREFS = (
+    ("h264_videotoolbox", ("-q:v", "65")),
+    ("h264_nvenc", ("-preset", "p1", "-rc", "constqp", "-qp", "18")),
+    ("h264_qsv", ("-global_quality", "18")),
+)
+
+
+@lru_cache(maxsize=4)
+def _pick_h264_encoder(ffmpeg_bin: str) -> tuple:
+    """
+    Best available H.264 encoder for this ffmpeg build, probed once per run.
+    Returns (codec_name, extra_args); falls back to libx264.
+    """
+    try:
+        out = subprocess.run(
+            [ffmpeg_bin, "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=10,
+        ).stdout.decode(errors="replace")
+    except Exception:
+        out = ""
+    for name, args in _H264_ENCODER_PREFS:
+        if name in out:
+            return name, args
+    return "libx264", _LIBX264_ARGS
 
 
 def make_still_video(img_path, out_path, seconds, ffmpeg_bin, fps, width, height, label=""):
@@ -429,12 +626,27 @@ def make_still_video(img_path, out_path, seconds, ffmpeg_bin, fps, width, height
         f"scale=w={width}:h={height}:force_original_aspect_ratio=decrease,"
         f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2"
     )
+    encoder, enc_args = _pick_h264_encoder(ffmpeg_bin)
+    try:
+        _encode_still(img_path, out_path, seconds, ffmpeg_bin, fps, vf, encoder, enc_args, label)
+    except subprocess.CalledProcessError:
+        if encoder == "libx264":
+            raise
+        # A listed encoder can still fail at runtime (no GPU, session limit).
+        info(f"[WARN] {encoder} failed; retrying with libx264")
+        _encode_still(img_path, out_path, seconds, ffmpeg_bin, fps, vf, "libx264", _LIBX264_ARGS, label)
+
+    if not os.path.exists(out_path) or os.path.getsize(out_path) == 0:
+        raise RuntimeError(f"ffmpeg finished without producing {out_path}")
+
+
+def _encode_still(img_path, out_path, seconds, ffmpeg_bin, fps, vf, encoder, enc_args, label=""):
     cmd = [
         ffmpeg_bin,
         "-y",
         "-hide_banner",
         "-nostdin",
-        "-stats",
+        "-nostats",
         "-loop",
         "1",
         "-i",
@@ -446,78 +658,112 @@ def make_still_video(img_path, out_path, seconds, ffmpeg_bin, fps, width, height
         "-vf",
         vf,
         "-c:v",
-        "libx264",
-        "-crf",
-        "18",
-        "-preset",
-        "veryfast",
-        "-tune",
-        "stillimage",
+        encoder,
+        *enc_args,
         "-pix_fmt",
         "yuv420p",
         "-movflags",
         "+faststart",
+        "-progress",
+        "pipe:1",
         out_path,
     ]
 
-    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, bufsize=1)
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=0)
     last_pct = -1
+    total_us = max(1000.0, seconds * 1_000_000)
     try:
-        for line in proc.stderr:
-            if "time=" in line:
-                match = re.search(r"time=(\d+:\d+:\d+\.\d+)", line)
-                if match:
-                    t = _parse_hms_to_seconds(match.group(1)) or 0.0
-                    pct = min(100, int((t / max(0.001, seconds)) * 100))
-                    if pct != last_pct:
-                        sys.stdout.write(f"\r[FFMPEG] {label} {pct:3d}% ({match.group(1)}/{seconds:.2f}s)")
-                        sys.stdout.flush()
-                        last_pct = pct
+        # -progress emits machine-readable key=value lines on stdout at a
+        # controlled cadence; out_time_ms is microseconds despite the name.
+        # No regex, no text-mode decode per line.
+        for raw in proc.stdout:
+            if raw.startswith(b"out_time_ms="):
+                try:
+                    t_us = int(raw[12:])
+                except ValueError:
+                    continue
+                pct = min(100, int(t_us * 100 / total_us))
+                if pct != last_pct:
+                    sys.stdout.write(f"\r[FFMPEG] {label} {pct:3d}% ({t_us / 1e6:.2f}/{seconds:.2f}s)")
+                    sys.stdout.flush()
+                    last_pct = pct
         ret = proc.wait()
         if ret != 0:
-            err = proc.stderr.read() if proc.stderr else ""
-            sys.stderr.write("\n[ffmpeg stderr]\n" + (err or "") + "\n")
+            err = proc.stderr.read().decode(errors="replace") if proc.stderr else ""
+            sys.stderr.write("\n[ffmpeg stderr]\n" + err + "\n")
             raise subprocess.CalledProcessError(ret, cmd)
     finally:
         sys.stdout.write("\r[FFMPEG] " + (label or os.path.basename(out_path)) + " 100%\n")
         sys.stdout.flush()
 
-    if not os.path.exists(out_path) or os.path.getsize(out_path) == 0:
-        raise RuntimeError(f"ffmpeg finished without producing {out_path}")
+
+_STILL_CACHE: dict[tuple, str] = {}
+
+
+def _make_still_video_cached(img_path, out_path, seconds, ffmpeg_bin, fps, width, height, label=""):
+    """
+    make_still_video, but identical (image, duration, fps, geometry) requests
+    within a run reuse the first encode instead of re-running libx264.
+    """
+    try:
+        # The path belongs in the key: copy2-preserved mtimes make distinct
+        # images with identical (mtime, size) entirely plausible.
+        st = os.stat(img_path)
+        key = (
+            os.path.abspath(str(img_path)),
+            st.st_mtime_ns,
+            st.st_size,
+            round(seconds, 3),
+            fps,
+            width,
+            height,
+        )
+    except OSError:
+        key = None
+    if key is not None:
+        cached = _STILL_CACHE.get(key)
+        if cached and os.path.exists(cached) and os.path.getsize(cached) > 0:
+            if os.path.abspath(cached) != os.path.abspath(str(out_path)):
+                shutil.copy2(cached, out_path)
+            return
+    make_still_video(img_path, out_path, seconds, ffmpeg_bin, fps, width, height, label=label)
+    if key is not None:
+        _STILL_CACHE[key] = str(out_path)
 
 
 def wait_media_item_by_path(root_folder, target_abs_path, timeout_s=10, poll_ms=200):
-    start = time.time()
     target_abs_path = os.path.abspath(target_abs_path)
-    while True:
-        clips = root_folder.GetClips() or {}
-        for _, clip in clips.items():
-            path = (clip.GetClipProperty("File Path") or "").strip()
+
+    def _scan():
+        for clip in (root_folder.GetClips() or {}).values():
+            path = _clip_file_path(clip)
             if path and os.path.abspath(path) == target_abs_path:
                 return clip
-        if (time.time() - start) >= timeout_s:
-            return None
-        time.sleep(poll_ms / 1000.0)
+        return None
+
+    return _poll_until(_scan, timeout_s, max_ms=poll_ms)
 
 
 def discover_images_map(image_dir: Path) -> dict[int, str]:
     mapping = {}
     try:
-        for name in os.listdir(image_dir):
-            path = os.path.join(image_dir, name)
-            if not os.path.isfile(path):
-                continue
-            if not re.search(r"(?i)\.(png|jpe?g)$", name):
-                continue
-            match = re.match(r"(?i)^im(\d+)\.(png|jpe?g)$", name)
-            if match:
-                idx = int(match.group(1))
-            else:
-                any_digits = re.search(r"(\d+)", Path(name).stem)
-                if not any_digits:
+        with os.scandir(image_dir) as entries:
+            for entry in entries:
+                # DirEntry.is_file reuses the readdir data; no stat per entry.
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                name = entry.name
+                if not _RE_IMG_EXT.search(name):
                     continue
-                idx = int(any_digits.group(1))
-            mapping[idx] = path
+                match = _RE_IMG_IDX.match(name)
+                if match:
+                    idx = int(match.group(1))
+                else:
+                    any_digits = _RE_ANY_DIGITS.search(Path(name).stem)
+                    if not any_digits:
+                        continue
+                    idx = int(any_digits.group(1))
+                mapping[idx] = os.path.abspath(entry.path)
     except FileNotFoundError:
         pass
     return mapping
@@ -525,43 +771,45 @@ def discover_images_map(image_dir: Path) -> dict[int, str]:
 
 def discover_videos_map(folder: Path) -> dict[int, Path]:
     mapping: dict[int, Path] = {}
-    if not folder.exists():
-        return mapping
-    for p in folder.iterdir():
-        if not p.is_file():
-            continue
-        if p.suffix.lower() not in VIDEO_EXTS:
-            continue
-        match = re.search(r"(\d+)", p.stem)
-        if not match:
-            continue
-        mapping[int(match.group(1))] = p
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                p = Path(os.path.abspath(entry.path))
+                if p.suffix.lower() not in VIDEO_EXTS:
+                    continue
+                match = _RE_ANY_DIGITS.search(p.stem)
+                if not match:
+                    continue
+                mapping[int(match.group(1))] = p
+    except FileNotFoundError:
+        pass
     return mapping
 
 
 def find_video_for_index(base_dir: Path, idx: int, extra_dirs: Optional[Sequence[Path]] = None) -> Optional[Path]:
-    patterns = {f"{idx:02d}", str(idx)}
-    candidates: List[Path] = []
+    patterns = (f"{idx:02d}", str(idx))
 
-    def _scan(folder: Path):
-        if not folder.exists():
+    def _iter_matches(folder: Path):
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot < 0 or name[dot:].lower() not in VIDEO_EXTS:
+                        continue
+                    if any(tok in name[:dot] for tok in patterns):
+                        yield Path(os.path.abspath(entry.path))
+        except FileNotFoundError:
             return
-        for p in folder.iterdir():
-            if not p.is_file():
-                continue
-            if p.suffix.lower() not in VIDEO_EXTS:
-                continue
-            if any(tok in p.stem for tok in patterns):
-                candidates.append(p)
 
-    _scan(base_dir)
-    video_dir = base_dir / "video"
-    _scan(video_dir)
-    for extra in extra_dirs or []:
-        _scan(extra)
-    if candidates:
-        return candidates[0]
-    return None
+    # Lazy scan: the first hit wins, so later folders (and the rest of the
+    # current one) are never touched once a match is found.
+    folders = (base_dir, base_dir / "video", *(extra_dirs or ()))
+    return next((p for folder in folders for p in _iter_matches(folder)), None)
 
 
 def list_timelines_with_index(project, prefix: str):
@@ -580,7 +828,7 @@ def list_timelines_with_index(project, prefix: str):
             name = ""
         if not name.lower().startswith(prefix.lower()):
             continue
-        match = re.search(r"(\d+)$", name)
+        match = _RE_TRAILING_DIGITS.search(name)
         if not match:
             info(f"[WARN] Timeline without numeric index: {name} (ignored)")
             continue
@@ -652,7 +900,7 @@ def sync_timelines(settings: Settings, only_indices: Optional[Sequence[int]] = N
             info(f"[SKIP] {tl_name} : no audio folder {candidates[0]} (or {candidates[1]})")
             continue
 
-        mp3s = sorted(glob.glob(str(track_dir / "*.mp3")), key=natural_key)
+        mp3s = _list_mp3s_sorted(track_dir)
         if not mp3s:
             info(f"[SKIP] {tl_name} : no .mp3 files in {track_dir}")
             continue
@@ -671,61 +919,113 @@ def sync_timelines(settings: Settings, only_indices: Optional[Sequence[int]] = N
         label = vid_path.name if vid_path else f"im{idx:02d}"
         print(f"  {tl_name}  -> {label}  ({len(mp3s)} mp3)")
 
+    # One concurrent probing pass up front; the per-clip loops below only do
+    # dict lookups instead of spawning ffprobe per file.
+    probe_targets: List[str] = [m for _, _, _, _, mp3s, _, _ in pairs for m in mp3s]
+    probe_targets += [str(vid) for _, _, vid, _, _, _, _ in pairs if vid]
+    durations_by_path = probe_durations_many(probe_targets, ffprobe)
+
     keep_paths = set(video_keep_candidates.values())
     purge_media_pool_except_timelineXX(project, mpool, settings, keep_paths=keep_paths)
 
+    frames_final = tc_to_frames(settings.core.final_duration_tc, settings.core.fps)
+    dur_seconds = frames_final / settings.core.fps
+    info(f"Target duration: {settings.core.final_duration_tc} ({frames_final} frames @ {settings.core.fps} fps)")
+
+    tmp_dir = settings.paths.tmp_stills_dir
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+
+    # When stills are rendered to MP4 up front (use_still_duration_in_resolve
+    # off), every encode is known in advance; run them concurrently before
+    # touching the Resolve API (which is not threadsafe). Each encode is a
+    # single-threaded libx264 job, so capped threads give near-linear speedup.
+    prebuilt_stills: set[int] = set()
+    if not settings.resolve.use_still_duration_in_resolve:
+        still_jobs = [
+            (idx, img, tl_name)
+            for idx, img, vid, _, _, tl_name, _ in pairs
+            if img and not vid
+        ]
+        if still_jobs:
+            workers = min(len(still_jobs), os.cpu_count() or 4, 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(
+                        _make_still_video_cached,
+                        img,
+                        str(tmp_dir / f"still_{idx:02d}.mp4"),
+                        dur_seconds,
+                        ffmpeg,
+                        settings.core.fps,
+                        settings.resolve.width,
+                        settings.resolve.height,
+                        label=tl_name,
+                    )
+                    for idx, img, tl_name in still_jobs
+                ]
+                for (idx, _, _), future in zip(still_jobs, futures):
+                    future.result()
+                    prebuilt_stills.add(idx)
+
+    # Everything the pair loop needs goes through one ImportMedia round trip;
+    # the per-pair imports below are fallbacks for paths Resolve dropped.
     to_import: set[str] = set()
     for _, img, vid, _, mp3s, _, _ in pairs:
         if vid:
-            to_import.add(os.path.abspath(str(vid)))
+            to_import.add(str(vid))
         elif img:
-            to_import.add(os.path.abspath(img))
+            to_import.add(img)
         for m in mp3s:
-            to_import.add(os.path.abspath(m))
+            to_import.add(m)
+    for idx in prebuilt_stills:
+        to_import.add(str(tmp_dir / f"still_{idx:02d}.mp4"))
     if to_import:
-        mpool.ImportMedia(list(to_import))
+        mpool.ImportMedia(sorted(to_import))
 
-    path2item = {}
-    for clip in iter_all_clips_recursive(root):
-        path = (clip.GetClipProperty("File Path") or "").strip()
-        if path:
-            path2item[os.path.abspath(path)] = clip
+    pool_index = MediaPoolIndex(root)
 
-    frames_final = tc_to_frames(settings.core.final_duration_tc, settings.core.fps)
-    dur_seconds = frames_final / settings.core.fps
-    info(f"Target duration: {settings.core.final_duration_tc} ({frames_final} frames @ {settings.core.fps} fps)")
-
-    tmp_dir = settings.paths.tmp_stills_dir
-    tmp_dir.mkdir(parents=True, exist_ok=True)
+    # Anything the bulk import dropped gets one batched re-import and a single
+    # index refresh; the pair loop below can then rely on plain dict lookups.
+    missing = [p for p in sorted(to_import) if pool_index.get(p) is None]
+    if missing:
+        mpool.ImportMedia(missing)
+        pool_index.refresh()
 
     silence_item = None
     if settings.resolve.pad_short_audio_with_silence:
         silence_wav = settings.paths.silence_stub_path
-        subprocess.run(
-            [
-                ffmpeg,
-                "-y",
-                "-f",
-                "lavfi",
-                "-i",
-                "anullsrc=r=48000:cl=stereo",
-                "-t",
-                f"{settings.resolve.silence_chunk_seconds:.3f}",
-                "-c:a",
-                "pcm_s16le",
-                str(silence_wav),
-            ],
-            check=True,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        # Reuse an existing stub whose size matches the configured duration
+        # (48 kHz stereo s16le is 192 kB/s plus a small header).
+        expected_bytes = int(settings.resolve.silence_chunk_seconds * 48000 * 2 * 2)
+        try:
+            reuse = abs(silence_wav.stat().st_size - expected_bytes) <= 4096
+        except OSError:
+            reuse = False
+        if not reuse:
+            subprocess.run(
+                [
+                    ffmpeg,
+                    "-y",
+                    "-hide_banner",
+                    "-nostdin",
+                    "-loglevel",
+                    "error",
+                    "-nostats",
+                    "-f",
+                    "lavfi",
+                    "-i",
+                    "anullsrc=r=48000:cl=stereo",
+                    "-t",
+                    f"{settings.resolve.silence_chunk_seconds:.3f}",
+                    "-c:a",
+                    "pcm_s16le",
+                    str(silence_wav),
+                ],
+                check=True,
+                capture_output=True,
+            )
         mpool.ImportMedia([str(silence_wav)])
-        clips = root.GetClips() or {}
-        for _, clip in clips.items():
-            path = (clip.GetClipProperty("File Path") or "").strip()
-            if path:
-                path2item[os.path.abspath(path)] = clip
-        silence_item = path2item.get(os.path.abspath(str(silence_wav)))
+        silence_item = pool_index.get_or_wait(silence_wav)
 
     ai_settings = build_auto_caption_settings(resolve, settings)
 
@@ -736,45 +1036,43 @@ def sync_timelines(settings: Settings, only_indices: Optional[Sequence[int]] = N
         preserved_video_item = None
         vid_candidate = video_keep_candidates.get(idx)
         if vid_candidate:
-            preserved_video_item = path2item.get(os.path.abspath(str(vid_candidate)))
+            preserved_video_item = pool_index.get(vid_candidate)
             if not preserved_video_item:
                 mpool.ImportMedia([str(vid_candidate)])
-                preserved_video_item = find_media_item_by_path(root, str(vid_candidate), timeout_s=10, poll_ms=200)
+                preserved_video_item = pool_index.get_or_wait(vid_candidate)
             if preserved_video_item:
-                preserve_video_paths.add(os.path.abspath(str(vid_candidate)))
+                preserve_video_paths.add(str(vid_candidate))
         clear_all_tracks_items(timeline, preserve_video_paths if preserve_video_paths else None)
 
+        # Video and audio instructions are accumulated here and shipped in a
+        # single AppendToTimeline per timeline. The use_still branch stays
+        # eager: its ffmpeg fallback is triggered by the append failing.
+        pending_instr: List[_Instr] = []
+
         if preserved_video_item:
             info(f"[{timeline_name}] Existing video kept: {vid_candidate.name}")
         elif video_path:
-            vid_item = path2item.get(os.path.abspath(str(video_path)))
+            vid_item = pool_index.get(video_path)
             if not vid_item:
                 mpool.ImportMedia([str(video_path)])
-                vid_item = find_media_item_by_path(root, str(video_path), timeout_s=10, poll_ms=200)
+                vid_item = pool_index.get_or_wait(video_path)
             if not vid_item:
                 fatal(f"Video not found in Media Pool after import: {video_path}")
 
-            clip_frames = int(round(probe_duration_seconds(str(video_path), ffprobe) * settings.core.fps))
+            vid_dur = durations_by_path.get(str(video_path))
+            if vid_dur is None:
+                vid_dur = probe_duration_seconds_cached(str(video_path), ffprobe)
+            clip_frames = int(round(vid_dur * settings.core.fps))
             clip_frames = max(1, clip_frames)
             end_frame = min(clip_frames - 1, max(0, frames_final - 1))
-            video_instr = [
-                {
-                    "mediaPoolItem": vid_item,
-                    "startFrame": 0,
-                    "endFrame": end_frame,
-                    "recordFrame": 0,
-                    "trackIndex": 1,
-                }
-            ]
-            ok = mpool.AppendToTimeline(video_instr)
-            assert ok, "Append video failed"
+            pending_instr.append(_Instr(vid_item, 0, end_frame, 0))
         elif settings.resolve.use_still_duration_in_resolve:
             if not img_path:
                 fatal(f"No image for index {idx:02d}")
-            still_item = path2item.get(os.path.abspath(img_path))
+            still_item = pool_index.get(img_path)
             if not still_item:
                 mpool.ImportMedia([img_path])
-                still_item = find_media_item_by_path(root, img_path, timeout_s=10, poll_ms=200)
+                still_item = pool_index.get_or_wait(img_path)
             if not still_item:
                 fatal(f"Image not found in Media Pool after import: {img_path}")
 
@@ -791,7 +1089,7 @@ def sync_timelines(settings: Settings, only_indices: Optional[Sequence[int]] = N
             if not ok:
                 info("[WARN] Append still failed, fallback to ffmpeg still MP4...")
                 tmp_mp4 = tmp_dir / f"still_{idx:02d}.mp4"
-                make_still_video(
+                _make_still_video_cached(
                     img_path,
                     str(tmp_mp4),
                     dur_seconds,
@@ -802,7 +1100,7 @@ def sync_timelines(settings: Settings, only_indices: Optional[Sequence[int]] = N
                     label=timeline_name,
                 )
                 mpool.ImportMedia([str(tmp_mp4)])
-                vid_item = find_media_item_by_path(root, str(tmp_mp4), timeout_s=10, poll_ms=200)
+                vid_item = pool_index.get_or_wait(tmp_mp4)
                 if not vid_item:
                     fatal(f"Temporary video missing after import: {tmp_mp4}")
                 video_instr = [
@@ -820,54 +1118,45 @@ def sync_timelines(settings: Settings, only_indices: Optional[Sequence[int]] = N
             if not img_path:
                 fatal(f"No image for index {idx:02d}")
             tmp_mp4 = tmp_dir / f"still_{idx:02d}.mp4"
-            make_still_video(
-                img_path,
-                str(tmp_mp4),
-                dur_seconds,
-                ffmpeg,
-                settings.core.fps,
-                settings.resolve.width,
-                settings.resolve.height,
-                label=timeline_name,
-            )
-            mpool.ImportMedia([str(tmp_mp4)])
-            vid_item = find_media_item_by_path(root, str(tmp_mp4), timeout_s=10, poll_ms=200)
+            if idx not in prebuilt_stills:
+                _make_still_video_cached(
+                    img_path,
+                    str(tmp_mp4),
+                    dur_seconds,
+                    ffmpeg,
+                    settings.core.fps,
+                    settings.resolve.width,
+                    settings.resolve.height,
+                    label=timeline_name,
+                )
+            vid_item = pool_index.get(tmp_mp4)
+            if not vid_item:
+                mpool.ImportMedia([str(tmp_mp4)])
+                vid_item = pool_index.get_or_wait(tmp_mp4)
             if not vid_item:
                 fatal(f"Temporary video missing after import: {tmp_mp4}")
-            video_instr = [
-                {
-                    "mediaPoolItem": vid_item,
-                    "startFrame": 0,
-                    "endFrame": max(0, frames_final - 1),
-                    "recordFrame": 0,
-                    "trackIndex": 1,
-                }
-            ]
-            ok = mpool.AppendToTimeline(video_instr)
-            assert ok, "Append video failed"
+            pending_instr.append(_Instr(vid_item, 0, max(0, frames_final - 1), 0))
 
         audio_items = []
         for audio_path in mp3_list:
-            abs_audio = os.path.abspath(audio_path)
-            clip = path2item.get(abs_audio)
-            if not clip:
-                mpool.ImportMedia([audio_path])
-                clip = find_media_item_by_path(root, audio_path, timeout_s=10, poll_ms=200)
-                if clip:
-                    path2item[abs_audio] = clip
+            clip = pool_index.get(audio_path)
             if not clip:
-                fatal(f"Audio clip not found: {audio_path}")
+                fatal(f"Audio clip not found in Media Pool: {audio_path}")
             audio_items.append(clip)
 
-        audio_instr = []
+        # Layout is collected as _Instr objects; the bridge dicts are
+        # materialized in one comprehension at the final append.
+        rows: List[_Instr] = []
         a_rec = 0
         remaining = frames_final
         trim_remaining = max(0, int(round(settings.core.trim_first_audio_seconds * settings.core.fps)))
         first_audio_seen = False
 
         for item in audio_items:
-            file_path = (item.GetClipProperty("File Path") or "").strip()
-            dur_sec = probe_duration_seconds(file_path, ffprobe)
+            file_path = _clip_file_path(item)
+            dur_sec = durations_by_path.get(os.path.abspath(file_path))
+            if dur_sec is None:
+                dur_sec = probe_duration_seconds_cached(file_path, ffprobe)
             clip_frames = int(round(dur_sec * settings.core.fps))
             if remaining <= 0 or clip_frames <= 0:
                 continue
@@ -882,37 +1171,30 @@ def sync_timelines(settings: Settings, only_indices: Optional[Sequence[int]] = N
                     clip_frames -= trim_remaining
                     trim_remaining = 0
             put = min(clip_frames, remaining)
-            audio_instr.append(
-                {
-                    "mediaPoolItem": item,
-                    "startFrame": start_in_clip,
-                    "endFrame": start_in_clip + max(0, put - 1),
-                    "recordFrame": a_rec,
-                    "trackIndex": 1,
-                }
-            )
+            rows.append(_Instr(item, start_in_clip, start_in_clip + max(0, put - 1), a_rec))
             a_rec += put
             remaining -= put
 
         if settings.resolve.pad_short_audio_with_silence and remaining > 0 and silence_item:
             sil_frames = int(round(settings.resolve.silence_chunk_seconds * settings.core.fps))
-            while remaining > 0:
-                put = min(sil_frames, remaining)
-                audio_instr.append(
-                    {
-                        "mediaPoolItem": silence_item,
-                        "startFrame": 0,
-                        "endFrame": max(0, put - 1),
-                        "recordFrame": a_rec,
-                        "trackIndex": 1,
-                    }
+            if sil_frames > 0:
+                # Whole chunks laid out arithmetically, then the tail.
+                full = remaining // sil_frames
+                rows.extend(
+                    _Instr(silence_item, 0, sil_frames - 1, a_rec + i * sil_frames)
+                    for i in range(full)
                 )
-                a_rec += put
-                remaining -= put
-
-        if audio_instr:
-            ok = mpool.AppendToTimeline(audio_instr)
-            assert ok, "Append audio failed"
+                a_rec += full * sil_frames
+                tail = remaining - full * sil_frames
+                if tail:
+                    rows.append(_Instr(silence_item, 0, tail - 1, a_rec))
+                    a_rec += tail
+                remaining = 0
+
+        pending_instr.extend(rows)
+        if pending_instr:
+            ok = mpool.AppendToTimeline([instr.as_dict() for instr in pending_instr])
+            assert ok, "Append clips failed"
 
         ok_ai = timeline.CreateSubtitlesFromAudio(ai_settings)
         info(f"[{timeline_name}] AI Subtitles: {'OK' if ok_ai else 'FAIL'}")
@@ -1,163 +1,394 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import re
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Sequence, Tuple, Union
+from typing import AsyncIterator, Dict, List, Optional, Sequence, Tuple, Union
+
+from openai import AsyncOpenAI
+
+try:
+    from orjson import dumps as _orjson_dumps, loads as _json_loads
+
+    def _json_dumps(obj) -> str:
+        return _orjson_dumps(obj).decode("utf-8")
+
+except ImportError:  # pragma: no cover - orjson not installed
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False)
 
-from openai import OpenAI
 
 from ..config import Settings
-from ..utils import img_to_data_url, normalize_title, split_examples
+from ..openai_client import get_client, run_sync
+from ..utils import image_sha256, img_to_data_url, normalize_title, split_examples
+
+
+# Cache-busting tag for the on-disk response cache; bump whenever any prompt
+# text below changes materially.
+_PROMPT_VERSION = "3"
+
+_TASKS_BASE = (
+    "TASK style - general titling assistant:\n"
+    "- Style: inspired by STYLE EXAMPLES (cadence/soft punctuation), no copy/paste.\n"
+    "- Relevance: reflect the image (gestures/symbols/ambience/location).\n"
+    "- Length: naturally aim ~55-65 chars when possible.\n\n"
+    "TASK devotional - prayerful, surrender, comfort:\n"
+    "- Tone: heartfelt prayers or God speaking ('My child'), humble surrender, encouragement.\n"
+    "- Style: follow the cadence of the DEVOTIONAL EXAMPLES (gentle pauses, en dashes, occasional pipes or [1 Hour]/1Hour tags).\n"
+    "- Relevance: echo the emotion or symbolism of the image (struggle, refuge, peace).\n"
+    "- Length: aim 45-80 characters; no emojis, no hashtags, no ALL CAPS.\n"
+    "- Keep reverent and truthful; avoid clickbait hooks.\n\n"
+    "TASK click - click-through-optimized headlines:\n"
+    "- Hooks: urgency/curiosity/emotion-but respectful and truthful (no sensational lies).\n"
+    "- Include 'Jesus' or 'Christ' when natural.\n"
+    "- Length: aim 48-70 characters.\n"
+    "- Style: NO emojis, NO ALL CAPS, NO hashtags.\n"
+)
+
+_TASK_GUIDED = (
+    "\nTASK guided - follow the USER INSTRUCTION as the main theme or angle:\n"
+    "- Respect the instruction faithfully, but stay truthful and reverent.\n"
+    "- Reflect the image context when possible.\n"
+    "- Include 'Jesus' or 'Christ' if natural.\n"
+    "- Length: aim 48-70 characters.\n"
+)
+
+_ALL_TITLES_PROMPT = (
+    "You write YouTube titles for a Christian channel about Jesus.\n"
+    "Look at the image once and complete {count} titling tasks in one pass.\n"
+    "Return a STRICT JSON object with EXACTLY these keys, EXACTLY 20 original titles each:\n"
+    "{{{keys_spec}}}\n\n"
+    "{tasks}\n"
+    "General rules:\n"
+    "- Language for click/guided: match the language of the STYLE EXAMPLES (hint only; do NOT copy their style).\n\n"
+    "STYLE EXAMPLES (style guide):\n{style_examples}\n\n"
+    "DEVOTIONAL EXAMPLES (style guide):\n{devotional_examples}\n"
+)
 
 
 class TitleService:
     """
     Wraps OpenAI calls for title ideation and scripture selection.
+
+    The API round trip dominates wall time, so the core methods are
+    coroutines sharing one AsyncOpenAI client (keep-alive connections,
+    no TLS handshake per call); `all_titles` fetches every variant in
+    one request. Each method keeps a plain sync wrapper for callers
+    that are not running an event loop.
     """
 
-    def __init__(self, settings: Settings, client: Optional[OpenAI] = None):
+    def __init__(self, settings: Settings, client: Optional[AsyncOpenAI] = None):
         self.settings = settings
-        self.client = client or OpenAI()
+        self._client = client
         self.examples = split_examples(settings.openai.title_examples_input)
         self.devotional_examples = split_examples(settings.openai.devotional_examples_input)
+        # The example blocks never change for the life of the service; build
+        # the bullet text once instead of per request.
+        self._examples_bullets = "\n".join(f"- {e}" for e in self.examples)
+        self._devotional_bullets = "\n".join(f"- {e}" for e in self.devotional_examples)
+        # Fully pre-rendered prompts: only the user instruction varies per
+        # call, so the plain prompt is a constant and the guided one is a
+        # prefix/suffix pair around the instruction.
+        footer = "\nReturn ONLY the JSON object. Be concise; no commentary."
+        self._plain_prompt = self._render_prompt(guided=False) + footer
+        self._guided_prefix = self._render_prompt(guided=True) + "\nUSER INSTRUCTION:\n"
+        self._guided_suffix = "\n" + footer
+        self._cache = self._open_cache()
+
+    def _render_prompt(self, guided: bool) -> str:
+        keys = ["style", "devotional", "click"] + (["guided"] if guided else [])
+        return _ALL_TITLES_PROMPT.format(
+            count="FOUR" if guided else "THREE",
+            keys_spec=", ".join(f'"{k}": ["t1","t2",...,"t20"]' for k in keys),
+            tasks=_TASKS_BASE + (_TASK_GUIDED if guided else ""),
+            style_examples=self._examples_bullets,
+            devotional_examples=self._devotional_bullets,
+        )
+
+    @staticmethod
+    def _open_cache() -> Optional[sqlite3.Connection]:
+        try:
+            cache_dir = Path.home() / ".cache" / "yt-agent"
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(cache_dir / "titles.db"), check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, created_at INT, payload TEXT)"
+            )
+            conn.commit()
+            return conn
+        except Exception:
+            # Cache is best-effort; a broken/unwritable cache dir must not
+            # take title generation down with it.
+            return None
+
+    def _cache_get(self, key: str) -> Optional[dict]:
+        if self._cache is None:
+            return None
+        try:
+            row = self._cache.execute("SELECT payload FROM responses WHERE key = ?", (key,)).fetchone()
+            return _json_loads(row[0]) if row else None
+        except Exception:
+            return None
+
+    def _cache_put(self, key: str, payload: dict) -> None:
+        if self._cache is None:
+            return
+        try:
+            self._cache.execute(
+                "INSERT OR REPLACE INTO responses (key, created_at, payload) VALUES (?, ?, ?)",
+                (key, int(time.time()), _json_dumps(payload)),
+            )
+            self._cache.commit()
+        except Exception:
+            pass
+
+    def _get_client(self) -> AsyncOpenAI:
+        if self._client is not None:
+            # Injected client; the caller owns its lifecycle.
+            return self._client
+        # Process-wide pooled client, shared across TitleService instances.
+        return get_client()
 
     # ----- Title ideation --------------------------------------------
-    def style_titles(self, img_path: Path) -> List[str]:
-        examples_text = "\n".join(f"- {e}" for e in self.examples)
-        data_url = img_to_data_url(img_path)
-        resp = self.client.responses.create(
-            model=self.settings.openai.model,
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": (
-                                "You are a YouTube titling assistant. "
-                                "Look at the image and return EXACTLY 20 original titles as a STRICT JSON object.\n"
-                                "Constraints:\n"
-                                "- Style: inspired by EXAMPLES (cadence/soft punctuation), no copy/paste.\n"
-                                "- Relevance: reflect the image (gestures/symbols/ambience/location).\n"
-                                "- Length: naturally aim ~55-65 chars when possible.\n\n"
-                                f"EXAMPLES (style guide):\n{examples_text}\n\n"
-                                'Return ONLY:\n{"titles": ["t1","t2",...,"t20"]}\n'
-                                "Do not add any explanation before or after the JSON."
-                            ),
-                        },
-                        {"type": "input_image", "image_url": data_url},
-                    ],
-                }
-            ],
+    async def all_titles_async(self, img_path: Path, instruction: str = "") -> Dict[str, List[str]]:
+        """
+        Every title variant for one image in a single request. The base64
+        image dominates input tokens, so asking for all four keyed lists at
+        once pays for it one time instead of once per variant.
+        """
+        instruction = (instruction or "").strip()
+
+        # Content-addressed cache: same image bytes + same prompts + same
+        # instruction means the stored answer is as good as a fresh call.
+        cache_key = hashlib.sha256(
+            f"{image_sha256(img_path)}|{_PROMPT_VERSION}|all_titles|{instruction}".encode("utf-8")
+        ).hexdigest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached
+
+        resp = await self._get_client().responses.create(
+            model=self.settings.openai.titles_model,
+            input=self._all_titles_input(img_path, instruction),
+            text={"format": {"type": "json_object"}},
+            max_output_tokens=2500,
+            temperature=0.7,
         )
-        return self._extract_titles(resp.output_text)
+        payload = self._extract_json(resp.output_text)
+        out = {k: self._clean_titles(payload.get(k, [])) for k in ("style", "devotional", "click", "guided")}
+        if not instruction:
+            out["guided"] = []
+        self._cache_put(cache_key, out)
+        return out
 
-    def devotional_titles(self, img_path: Path) -> List[str]:
-        examples_text = "\n".join(f"- {e}" for e in self.devotional_examples)
-        data_url = img_to_data_url(img_path)
-        resp = self.client.responses.create(
-            model=self.settings.openai.model,
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": (
-                                "You craft devotional YouTube titles (prayerful, surrender, comfort).\n"
-                                "Look at the image and return EXACTLY 20 titles as a STRICT JSON object.\n"
-                                "Constraints:\n"
-                                "- Tone: heartfelt prayers or God speaking ('My child'), humble surrender, encouragement.\n"
-                                "- Style: follow the cadence of the EXAMPLES (gentle pauses, en dashes, occasional pipes or [1 Hour]/1Hour tags).\n"
-                                "- Relevance: echo the emotion or symbolism of the image (struggle, refuge, peace).\n"
-                                "- Length: aim 45-80 characters; no emojis, no hashtags, no ALL CAPS.\n"
-                                "- Keep reverent and truthful; avoid clickbait hooks.\n\n"
-                                f"EXAMPLES (style guide):\n{examples_text}\n\n"
-                                'Return ONLY:\n{"titles": ["t1","t2",...,"t20"]}\n'
-                                "Do not add any explanation before or after the JSON."
-                            ),
-                        },
-                        {"type": "input_image", "image_url": data_url},
-                    ],
-                }
-            ],
+    def _all_titles_input(self, img_path: Path, instruction: str) -> list:
+        if instruction:
+            prompt = self._guided_prefix + instruction + self._guided_suffix
+        else:
+            prompt = self._plain_prompt
+        return [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "input_text", "text": prompt},
+                    {"type": "input_image", "image_url": img_to_data_url(img_path)},
+                ],
+            }
+        ]
+
+    async def stream_titles_async(
+        self, img_path: Path, instruction: str = ""
+    ) -> AsyncIterator[Tuple[str, List[str]]]:
+        """
+        Streaming variant of all_titles_async: yields (variant, titles) as
+        soon as each keyed list closes in the response stream, so the UI can
+        show the first list while the model is still generating the rest.
+        """
+        instruction = (instruction or "").strip()
+        keys = ["style", "devotional", "click"]
+        if instruction:
+            keys.append("guided")
+
+        cache_key = hashlib.sha256(
+            f"{image_sha256(img_path)}|{_PROMPT_VERSION}|all_titles|{instruction}".encode("utf-8")
+        ).hexdigest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            for k in keys:
+                yield k, cached.get(k, [])
+            return
+
+        stream = await self._get_client().responses.create(
+            model=self.settings.openai.titles_model,
+            input=self._all_titles_input(img_path, instruction),
+            text={"format": {"type": "json_object"}},
+            max_output_tokens=2500,
+            temperature=0.7,
+            stream=True,
         )
-        return self._extract_titles(resp.output_text)
+        parts: List[str] = []
+        done: set[str] = set()
+        out: Dict[str, List[str]] = {}
+        async for event in stream:
+            delta = getattr(event, "delta", None)
+            if not isinstance(delta, str):
+                continue
+            parts.append(delta)
+            if "]" not in delta:
+                continue
+            text = "".join(parts)
+            for k in keys:
+                if k in done:
+                    continue
+                lst = self._completed_list(text, k)
+                if lst is not None:
+                    done.add(k)
+                    out[k] = self._clean_titles(lst)
+                    yield k, out[k]
 
-    def click_titles(self, img_path: Path) -> List[str]:
-        lang_hint = "\n".join(f"- {e}" for e in self.examples)
-        data_url = img_to_data_url(img_path)
-        resp = self.client.responses.create(
-            model=self.settings.openai.model,
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": (
-                                "You are a viral YouTube headline copywriter for a Christian channel about Jesus.\n"
-                                "Look at the image and return EXACTLY 20 click-through-optimized titles as STRICT JSON.\n"
-                                "Constraints:\n"
-                                "- Hooks: urgency/curiosity/emotion-but respectful and truthful (no sensational lies).\n"
-                                "- Include 'Jesus' or 'Christ' when natural.\n"
-                                "- Length: aim 48-70 characters.\n"
-                                "- Style: NO emojis, NO ALL CAPS, NO hashtags.\n"
-                                "- Language: match the language of the EXAMPLES below (language hint only; do NOT copy their style).\n\n"
-                                f"EXAMPLES (language hint only):\n{lang_hint}\n\n"
-                                'Return ONLY:\n{"titles": ["t1","t2",...,"t20"]}\n'
-                                "No explanation, JSON only."
-                            ),
+        # Anything the incremental scan missed comes from the final parse,
+        # which also feeds the cache.
+        try:
+            payload = self._extract_json("".join(parts))
+        except Exception:
+            payload = {}
+        for k in keys:
+            if k not in done:
+                out[k] = self._clean_titles(payload.get(k, []))
+                yield k, out[k]
+        for k in ("style", "devotional", "click", "guided"):
+            out.setdefault(k, [])
+        self._cache_put(cache_key, out)
+
+    @staticmethod
+    def _completed_list(text: str, key: str) -> Optional[list]:
+        """The JSON array for key, or None while it is still streaming."""
+        m = re.search(r'"%s"\s*:\s*\[' % re.escape(key), text)
+        if not m:
+            return None
+        start = m.end() - 1
+        # A "]" inside a title (e.g. "[1 Hour]") fails the parse; keep
+        # scanning to the next candidate close bracket.
+        pos = text.find("]", m.end())
+        while pos != -1:
+            try:
+                return _json_loads(text[start : pos + 1])
+            except ValueError:
+                pos = text.find("]", pos + 1)
+        return None
+
+    # ----- Batch API (offline jobs) ----------------------------------
+    async def enqueue_title_batch_async(self, jobs: Sequence[Tuple[Path, str]]) -> str:
+        """
+        Submit many images for offline title generation through the Batch
+        API: half-price tokens, a separate rate-limit pool, and up to 24 h
+        turnaround. jobs is (img_path, instruction) pairs; returns the batch
+        id to pass to collect_title_batch later.
+        """
+        lines = []
+        for i, (img_path, instruction) in enumerate(jobs):
+            instruction = (instruction or "").strip()
+            lines.append(
+                _json_dumps(
+                    {
+                        "custom_id": f"{i:04d}|{Path(img_path).name}",
+                        "method": "POST",
+                        "url": "/v1/responses",
+                        "body": {
+                            "model": self.settings.openai.titles_model,
+                            "input": self._all_titles_input(Path(img_path), instruction),
+                            "text": {"format": {"type": "json_object"}},
+                            "max_output_tokens": 2500,
+                            "temperature": 0.7,
                         },
-                        {"type": "input_image", "image_url": data_url},
-                    ],
-                }
-            ],
+                    }
+                )
+            )
+        client = self._get_client()
+        upload = await client.files.create(
+            file=("title_batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = await client.batches.create(
+            input_file_id=upload.id,
+            endpoint="/v1/responses",
+            completion_window="24h",
         )
-        return self._extract_titles(resp.output_text)
+        return batch.id
 
-    def guided_titles(self, img_path: Path, instruction: str) -> List[str]:
-        lang_hint = "\n".join(f"- {e}" for e in self.examples)
-        instruction = (instruction or "").strip()
-        if not instruction:
+    async def collect_title_batch_async(self, batch_id: str) -> Optional[Dict[str, Dict[str, List[str]]]]:
+        """
+        One status check; returns {custom_id: variant dict} once the batch
+        has completed, None while it is still running.
+        """
+        client = self._get_client()
+        batch = await client.batches.retrieve(batch_id)
+        if batch.status != "completed":
+            return None
+        content = await client.files.content(batch.output_file_id)
+        results: Dict[str, Dict[str, List[str]]] = {}
+        for line in content.text.splitlines():
+            if not line.strip():
+                continue
+            rec = _json_loads(line)
+            raw = self._batch_output_text(rec.get("response", {}).get("body", {}))
+            try:
+                payload = self._extract_json(raw)
+            except Exception:
+                continue
+            results[rec.get("custom_id", "")] = {
+                k: self._clean_titles(payload.get(k, []))
+                for k in ("style", "devotional", "click", "guided")
+            }
+        return results
+
+    @staticmethod
+    def _batch_output_text(body: dict) -> str:
+        # Batch output rows carry the raw response JSON, so output_text has
+        # to be reassembled from the message content blocks.
+        parts = []
+        for item in body.get("output", []) or []:
+            for block in item.get("content", []) or []:
+                if block.get("type") == "output_text":
+                    parts.append(block.get("text", ""))
+        return "".join(parts)
+
+    async def style_titles_async(self, img_path: Path) -> List[str]:
+        return (await self.all_titles_async(img_path))["style"]
+
+    async def devotional_titles_async(self, img_path: Path) -> List[str]:
+        return (await self.all_titles_async(img_path))["devotional"]
+
+    async def click_titles_async(self, img_path: Path) -> List[str]:
+        return (await self.all_titles_async(img_path))["click"]
+
+    async def guided_titles_async(self, img_path: Path, instruction: str) -> List[str]:
+        if not (instruction or "").strip():
             return []
+        return (await self.all_titles_async(img_path, instruction))["guided"]
 
-        data_url = img_to_data_url(img_path)
-        resp = self.client.responses.create(
-            model=self.settings.openai.model,
-            input=[
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "input_text",
-                            "text": (
-                                "You write YouTube titles for a Christian channel about Jesus.\n"
-                                "Look at the image and generate EXACTLY 20 titles as STRICT JSON, "
-                                "following the USER INSTRUCTION below as the main theme or angle.\n"
-                                "Constraints:\n"
-                                "- Respect the instruction faithfully, but stay truthful and reverent.\n"
-                                "- Reflect the image context when possible.\n"
-                                "- Include 'Jesus' or 'Christ' if natural.\n"
-                                "- Length: aim 48-70 characters.\n"
-                                "- Language: match the language of the EXAMPLES (hint only; do not copy their style).\n\n"
-                                f"EXAMPLES (language hint only):\n{lang_hint}\n\n"
-                                f"USER INSTRUCTION:\n{instruction}\n\n"
-                                'Return ONLY:\n{"titles": ["t1","t2",...,"t20"]}\n'
-                                "No explanation, JSON only."
-                            ),
-                        },
-                        {"type": "input_image", "image_url": data_url},
-                    ],
-                }
-            ],
-        )
-        return self._extract_titles(resp.output_text)
+    async def all_variants_async(self, img_path: Path, instruction: str = "") -> Dict[str, List[str]]:
+        return await self.all_titles_async(img_path, instruction)
 
     # ----- Scripture references -------------------------------------
-    def best_references(
+    async def best_references_async(
         self, img_path: Path, chosen_title: str
     ) -> Tuple[List[str], List[int], List[Union[str, int]]]:
+        # Deterministic per (image bytes, normalized title); a repeat pick of
+        # the same title for the same thumbnail is served from the cache.
+        cache_key = hashlib.sha256(
+            f"{image_sha256(img_path)}|{_PROMPT_VERSION}|best_refs|{normalize_title(chosen_title)}".encode("utf-8")
+        ).hexdigest()
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            return cached.get("gospels", []), cached.get("psalms", []), cached.get("combined", [])
+
         data_url = img_to_data_url(img_path)
         prompt = (
             "You are a liturgical curator for YouTube videos about Jesus.\n"
@@ -179,8 +410,8 @@ class TitleService:
             "- Return JSON ONLY. No comments, no extra keys.\n"
         )
 
-        resp = self.client.responses.create(
-            model=self.settings.openai.model,
+        resp = await self._get_client().responses.create(
+            model=self.settings.openai.refs_model,
             input=[
                 {
                     "role": "user",
@@ -191,6 +422,9 @@ class TitleService:
                     ],
                 }
             ],
+            text={"format": {"type": "json_object"}},
+            max_output_tokens=300,
+            temperature=0.7,
         )
 
         raw = resp.output_text.strip()
@@ -204,33 +438,82 @@ class TitleService:
                 combined.append(value)
             elif isinstance(value, str) and value.strip():
                 combined.append(value.strip())
+        self._cache_put(cache_key, {"gospels": gospels, "psalms": psalms, "combined": combined})
         return gospels, psalms, combined
 
+    # ----- sync wrappers ---------------------------------------------
+    # All wrappers run on the shared background loop (run_sync) rather than
+    # asyncio.run: a fresh loop per call would also mean a fresh pooled
+    # client per call, throwing away every keep-alive connection.
+    def style_titles(self, img_path: Path) -> List[str]:
+        return run_sync(self.style_titles_async(img_path))
+
+    def devotional_titles(self, img_path: Path) -> List[str]:
+        return run_sync(self.devotional_titles_async(img_path))
+
+    def click_titles(self, img_path: Path) -> List[str]:
+        return run_sync(self.click_titles_async(img_path))
+
+    def guided_titles(self, img_path: Path, instruction: str) -> List[str]:
+        return run_sync(self.guided_titles_async(img_path, instruction))
+
+    def stream_titles(self, img_path: Path, instruction: str = ""):
+        # Generator wrapper: each step runs on the shared loop so plain-sync
+        # callers can still consume titles progressively.
+        agen = self.stream_titles_async(img_path, instruction)
+        try:
+            while True:
+                try:
+                    yield run_sync(agen.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            run_sync(agen.aclose())
+
+    def enqueue_title_batch(self, jobs: Sequence[Tuple[Path, str]]) -> str:
+        return run_sync(self.enqueue_title_batch_async(jobs))
+
+    def collect_title_batch(self, batch_id: str) -> Optional[Dict[str, Dict[str, List[str]]]]:
+        return run_sync(self.collect_title_batch_async(batch_id))
+
+    def all_titles(self, img_path: Path, instruction: str = "") -> Dict[str, List[str]]:
+        return run_sync(self.all_titles_async(img_path, instruction))
+
+    def all_variants(self, img_path: Path, instruction: str = "") -> Dict[str, List[str]]:
+        return run_sync(self.all_variants_async(img_path, instruction))
+
+    def best_references(
+        self, img_path: Path, chosen_title: str
+    ) -> Tuple[List[str], List[int], List[Union[str, int]]]:
+        return run_sync(self.best_references_async(img_path, chosen_title))
+
     # ----- internal helpers ------------------------------------------
     def _extract_titles(self, raw: str) -> List[str]:
-        payload = self._extract_json(raw)
-        titles = [
-            t.strip()
-            for t in payload.get("titles", [])
-            if isinstance(t, str) and t.strip()
-        ]
-        seen, deduped = set(), []
-        for title in titles:
-            norm = normalize_title(title)
-            if norm not in seen:
-                seen.add(norm)
-                deduped.append(title)
-        return deduped
+        return self._clean_titles(self._extract_json(raw).get("titles", []))
+
+    @staticmethod
+    def _clean_titles(items) -> List[str]:
+        # Insertion-ordered dict keyed by the normalized form: first
+        # occurrence wins, dedup bookkeeping stays in C.
+        seen: Dict[str, str] = {}
+        for t in items:
+            if isinstance(t, str) and (t := t.strip()):
+                seen.setdefault(normalize_title(t), t)
+        return list(seen.values())
 
     @staticmethod
     def _extract_json(raw: str) -> dict:
+        # JSON mode means the body normally parses as-is; the substring
+        # slice only runs for the rare response wrapped in prose.
         text = raw.strip()
-        if not text.startswith("{"):
+        try:
+            return _json_loads(text)
+        except ValueError:
             start = text.find("{")
             end = text.rfind("}")
             if start != -1 and end != -1 and end > start:
-                text = text[start : end + 1]
-        return json.loads(text)
+                return _json_loads(text[start : end + 1])
+            raise
 
     @staticmethod
     def _coerce_psalms(items: Sequence[Union[int, str]]) -> List[int]:
@@ -240,12 +523,7 @@ class TitleService:
                 out.append(item)
             elif isinstance(item, str) and item.strip().isdigit():
                 out.append(int(item.strip()))
-        seen, deduped = set(), []
-        for ps in out:
-            if ps not in seen:
-                seen.add(ps)
-                deduped.append(ps)
-        return deduped
+        return list(dict.fromkeys(out))
 
 
 def write_refs_lists(destination: Path, gospels: List[str], psalms: List[int], combined: List[Union[str, int]]) -> None:
@@ -254,16 +532,30 @@ def write_refs_lists(destination: Path, gospels: List[str], psalms: List[int], c
     """
 
     def _to_json(lst):
-        return json.dumps(lst, ensure_ascii=False)
+        return _json_dumps(lst)
 
     destination.mkdir(parents=True, exist_ok=True)
-    (destination / "gospels_list.txt").write_text(_to_json(gospels) + "\n", encoding="utf-8")
-    (destination / "psalms_list.txt").write_text(_to_json(psalms) + "\n", encoding="utf-8")
-    (destination / "combined_list.txt").write_text(_to_json(combined) + "\n", encoding="utf-8")
+    jobs = [
+        (destination / "gospels_list.txt", f"{_to_json(gospels)}\n".encode("utf-8")),
+        (destination / "psalms_list.txt", f"{_to_json(psalms)}\n".encode("utf-8")),
+        (destination / "combined_list.txt", f"{_to_json(combined)}\n".encode("utf-8")),
+    ]
 
     refs = [
         f"GOSPELS  = {_to_json(gospels)}",
         f"PSALMS   = {_to_json(psalms)}",
         f"BEST_REFS= {_to_json(combined)}",
     ]
-    (destination / "refs_for_python.txt").write_text("\n".join(refs) + "\n", encoding="utf-8")
+    refs_path = destination / "refs_for_python.txt"
+    refs_bytes = ("\n".join(refs) + "\n").encode("utf-8")
+    try:
+        unchanged = refs_path.read_bytes() == refs_bytes
+    except OSError:
+        unchanged = False
+    if not unchanged:
+        jobs.append((refs_path, refs_bytes))
+
+    # Pre-encoded bytes (no codec wrapper) written concurrently; the
+    # open/write/close syscalls overlap, which matters on network mounts.
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        list(pool.map(lambda job: job[0].write_bytes(job[1]), jobs))
@@ -1,21 +1,35 @@
 from __future__ import annotations
 
 import base64
+import hashlib
+import os
 import re
 import shutil
 from datetime import timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
-_WS_RE = re.compile(r"\s+")
-_PUNCT_RE = re.compile(r"[^\w\s]", re.UNICODE)
+_NON_WORD_RE = re.compile(r"\W+", re.UNICODE)
+
+
+# expand_path results keyed on (value, base); Path.resolve() stats every
+# component, and settings loading re-expands the same dozen literals per run.
+_EXPANDED_PATHS: dict = {}
 
 
 def expand_path(value: str | Path, base: Path | None = None) -> Path:
+    key = (str(value), str(base) if base else None)
+    cached = _EXPANDED_PATHS.get(key)
+    if cached is not None:
+        return cached
     path = Path(value).expanduser()
     if base and not path.is_absolute():
-        return (base / path).resolve()
-    return path.resolve()
+        path = (base / path).resolve()
+    else:
+        path = path.resolve()
+    _EXPANDED_PATHS[key] = path
+    return path
 
 
 def split_examples(raw: str) -> List[str]:
@@ -23,15 +37,23 @@ def split_examples(raw: str) -> List[str]:
 
 
 def normalize_title(title: str) -> str:
-    txt = title.strip().casefold()
-    txt = _PUNCT_RE.sub("", txt)
-    txt = _WS_RE.sub(" ", txt)
-    return txt
-
-
+    # One regex pass: a non-word run collapses to a single space when it
+    # contains whitespace and disappears otherwise, matching the old
+    # punct-strip + whitespace-collapse sequence ("a - b" -> "a b",
+    # "don't" -> "dont") without the intermediate strings.
+    txt = _NON_WORD_RE.sub(
+        lambda m: " " if any(map(str.isspace, m.group())) else "",
+        title.casefold(),
+    )
+    return txt.strip()
+
+
+@lru_cache(maxsize=64)
 def tc_to_frames(tc: str, fps: int) -> int:
-    h, m, s, f = [int(x) for x in tc.split(":")]
-    return int(round(((h * 3600 + m * 60 + s) * fps) + f))
+    # Pure integer math over a handful of distinct timecodes per run; the
+    # inputs are whole numbers so there is nothing to round.
+    h, m, s, f = tc.split(":", 3)
+    return (int(h) * 3600 + int(m) * 60 + int(s)) * fps + int(f)
 
 
 def frames_to_seconds(frames: int, fps: int) -> float:
@@ -42,14 +64,51 @@ def format_ts(seconds_float: float) -> str:
     return str(timedelta(seconds=int(max(0, seconds_float))))
 
 
-def img_to_data_url(img_path: Path) -> str:
+# Digests keyed on (path, mtime_ns, size); the same thumbnail is hashed for
+# every title/reference call, but only read once per on-disk version.
+_IMAGE_HASHES: dict = {}
+
+
+def image_sha256(img_path: Path) -> str:
+    st = img_path.stat()
+    key = (str(img_path), st.st_mtime_ns, st.st_size)
+    cached = _IMAGE_HASHES.get(key)
+    if cached is None:
+        cached = hashlib.sha256(img_path.read_bytes()).hexdigest()
+        _IMAGE_HASHES[key] = cached
+    return cached
+
+
+@lru_cache(maxsize=32)
+def _img_to_data_url_cached(path_str: str, mtime_ns: int, size: int) -> str:
+    img_path = Path(path_str)
     mime = "image/jpeg" if img_path.suffix.lower() in {".jpg", ".jpeg"} else "image/png"
-    b64 = base64.b64encode(img_path.read_bytes()).decode("utf-8")
-    return f"data:{mime};base64,{b64}"
+    # Encode in multiples of 57 bytes: 57 bytes -> 76 base64 chars with no
+    # padding, so chunks concatenate cleanly and the raw file bytes never
+    # sit in memory all at once.
+    buf = bytearray(b"data:%b;base64," % mime.encode("ascii"))
+    with img_path.open("rb") as f:
+        while chunk := f.read(57 * 4096):
+            buf += base64.b64encode(chunk)
+    return buf.decode("ascii")
+
+
+def img_to_data_url(img_path: Path) -> str:
+    # Keyed on (path, mtime, size) so one encode serves every call made
+    # against the same on-disk version of the image.
+    st = img_path.stat()
+    return _img_to_data_url_cached(str(img_path), st.st_mtime_ns, st.st_size)
+
+
+_INDEX_RE = re.compile(r"(\d+)")
 
 
 def extract_index_from_name(name: str) -> Optional[int]:
-    match = re.search(r"(\d+)", Path(name).stem)
+    stem = Path(name).stem
+    # Fast path for the canonical imXX naming; skips the regex engine.
+    if stem.startswith("im") and stem[2:].isdigit():
+        return int(stem[2:])
+    match = _INDEX_RE.search(stem)
     return int(match.group(1)) if match else None
 
 
@@ -68,8 +127,15 @@ def coerce_iterable_str(items: Iterable[str | int]) -> List[str | int]:
     return out
 
 
+@lru_cache(maxsize=64)
+def _which_cached(bin_name: str, path_env: str) -> Optional[str]:
+    # path_env is only part of the key: a changed $PATH invalidates the
+    # entry, otherwise repeat lookups skip the per-directory stat walk.
+    return shutil.which(bin_name)
+
+
 def require_bin(bin_name: str) -> str:
-    path = shutil.which(bin_name)
+    path = _which_cached(bin_name, os.environ.get("PATH", ""))
     if not path:
         raise RuntimeError(f"{bin_name} not found in PATH. Install it (e.g. brew install {bin_name}).")
     return path
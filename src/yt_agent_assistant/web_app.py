@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import os
+import queue
 import subprocess
 import sys
 import threading
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
@@ -12,16 +15,28 @@ from flask import (
     abort,
     flash,
     redirect,
-    render_template_string,
     request,
+    send_file,
+    stream_with_context,
     url_for,
 )
+from jinja2 import ChoiceLoader, DictLoader, FileSystemBytecodeCache
 
 from .config import Settings
 from .services.audio import AudioEngine
 from .services.images import ImageRepository, human_mb
 from .services.titles import TitleService, write_refs_lists
-from .utils import extract_index_from_name, img_to_data_url, normalize_title, require_bin
+from .utils import extract_index_from_name, normalize_title, require_bin
+
+# Set whenever a UI action produces new tracks/chapters; lets supervising
+# scripts (run_all.py) wake immediately instead of polling the filesystem.
+sync_signal = threading.Event()
+
+# In-flight guard shared by every Resolve sync entry point (UI auto-trigger
+# and run_all.py's final sync) so two syncs never race against Resolve.
+# A lock rather than an Event: acquire(blocking=False) is atomic, so two
+# simultaneous triggers can't both pass an is_set() check and double-launch.
+resolve_inflight = threading.Lock()
 
 PAGE_TMPL = """<!doctype html>
 <html>
@@ -81,7 +96,7 @@ PAGE_TMPL = """<!doctype html>
   <div class="wrap">
     <div class="card">
       <div class="title">Thumbnail</div>
-      <img src="{{ data_url }}" alt="thumbnail">
+      <img src="{{ url_for('thumb', i=idx) }}" alt="thumbnail">
       <div class="meta">{{ subdir }}</div>
       <div class="footer">
         <form method="post" action="{{ url_for('skip', i=idx) }}">
@@ -155,6 +170,27 @@ DONE_TMPL = """<!doctype html>
   {% if resolve_note %}
     <p>{{ resolve_note }}</p>
   {% endif %}
+  {% if pending %}
+    <p id="build-status">Track builds in progress: {{ pending|length }} remaining.</p>
+    <script>
+      var pending = {{ pending|tojson }};
+      function poll() {
+        Promise.all(pending.map(function (i) {
+          return fetch("/status/" + i).then(function (r) { return r.json(); });
+        })).then(function (states) {
+          var left = states.filter(function (s) { return s.status === "running"; }).length;
+          var el = document.getElementById("build-status");
+          if (left) {
+            el.textContent = "Track builds in progress: " + left + " remaining.";
+            setTimeout(poll, 2000);
+          } else {
+            el.textContent = "All track builds finished.";
+          }
+        });
+      }
+      setTimeout(poll, 1000);
+    </script>
+  {% endif %}
   <p>Run the Resolve sync script to pull trackXX/ and chaptersXX.txt.</p>
   <p><a href="{{ url_for('restart') }}">Re-scan</a></p>
 </body>
@@ -162,47 +198,180 @@ DONE_TMPL = """<!doctype html>
 """
 
 
+def serve_app(app: Flask, settings: Settings, host: str, port: int) -> None:
+    """
+    Run the UI with waitress (threaded WSGI) unless debug mode asks for Werkzeug.
+    """
+    if settings.flask.debug:
+        app.run(host=host, port=port, debug=True, use_reloader=False)
+        return
+    from waitress import serve
+
+    serve(app, host=host, port=port, threads=8)
+
+
 def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
     app = Flask(__name__)
     app.secret_key = settings.flask.secret_key
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = settings.flask.static_cache_seconds
+
+    # Compile both templates once; render_template_string() would re-run the
+    # Jinja compiler on every request for these inline sources. Loading them
+    # by name through a DictLoader (rather than from_string) lets the
+    # bytecode cache persist the compiled code across restarts. Block
+    # trimming drops the indentation/newline runs around {% %} tags from
+    # the rendered HTML; set before compilation so the cached code has it.
+    app.jinja_env.trim_blocks = True
+    app.jinja_env.lstrip_blocks = True
+    cache_dir = settings.paths.log_dir / ".jinja_cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    app.jinja_env.bytecode_cache = FileSystemBytecodeCache(directory=str(cache_dir))
+    app.jinja_env.auto_reload = settings.flask.debug
+    app.jinja_env.loader = ChoiceLoader(
+        [DictLoader({"page.html": PAGE_TMPL, "done.html": DONE_TMPL}), app.jinja_env.loader]
+    )
+    page_template = app.jinja_env.get_template("page.html")
+    done_template = app.jinja_env.get_template("done.html")
 
     repo = ImageRepository(settings)
     title_service = TitleService(settings)
     audio_engine = AudioEngine(settings)
-    state = {"ordered": []}
-    trigger_event = threading.Event()
+    # Probe once at startup instead of on every title submission; a missing
+    # ffprobe fails fast here rather than mid-session.
+    require_bin("ffprobe")
+    state = {"ordered": [], "mtime": 0.0}
+    state_lock = threading.Lock()
 
     repo.ensure_dirs()
     if settings.flask.reset_on_start:
         repo.hard_reset_state()
 
     def _ordered_images() -> List[Path]:
-        if not state["ordered"]:
-            imgs = repo.list_images()
-            if not imgs:
-                return []
-            state["ordered"] = imgs
-        return state["ordered"]
-
-    def _load_titles(path: Path) -> List[str]:
-        if path.exists():
-            return [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
-        return []
+        # A single stat() of the image dir guards the cached listing; only a
+        # changed directory mtime (or an explicit invalidation from restart /
+        # factory_reset) re-runs the scandir+sort in list_images().
+        with state_lock:
+            try:
+                mtime = repo.image_dir.stat().st_mtime
+            except OSError:
+                mtime = 0.0
+            if not state["ordered"] or mtime != state["mtime"]:
+                state["ordered"] = repo.list_images()
+                state["mtime"] = mtime
+            return state["ordered"]
+
+    # Image-derived context keyed on (path, mtime_ns): the thumbnail check
+    # and the base64 data URLs are O(filesize) and identical for every view
+    # of the same on-disk image, so Prev/Next backtracks hit this instead.
+    _img_ctx_cache: dict = {}
+
+    def _image_ctx(img: Path) -> dict:
+        st = img.stat()
+        key = (str(img), st.st_mtime_ns)
+        ctx = _img_ctx_cache.get(key)
+        if ctx is None:
+            yt_path, orig_bytes, yt_bytes = repo.ensure_yt_thumbnail(img)
+            ctx = {
+                "orig_size_str": human_mb(orig_bytes),
+                "yt_size_str": human_mb(yt_bytes) if yt_bytes is not None else None,
+                "yt_path_str": str(yt_path) if yt_path else None,
+            }
+            if len(_img_ctx_cache) >= 32:
+                _img_ctx_cache.pop(next(iter(_img_ctx_cache)))
+            _img_ctx_cache[key] = ctx
+        return ctx
+
+    # Neighbour prefetch: while the user looks at image k, a worker thread
+    # warms _image_ctx for k+1/k-1 so the thumbnail encode has usually
+    # finished by the time Next/Prev is clicked.
+    _prefetch_queue: "queue.Queue[int]" = queue.Queue()
+
+    def _prefetch_worker() -> None:
+        while True:
+            j = _prefetch_queue.get()
+            try:
+                ordered = _ordered_images()
+                if 0 <= j < len(ordered):
+                    _image_ctx(ordered[j])
+            except Exception:
+                pass
+            finally:
+                _prefetch_queue.task_done()
+
+    threading.Thread(target=_prefetch_worker, daemon=True).start()
+
+    # Title warmup: devotional titles for every image missing them are
+    # generated in the background right after a scan, so the first visit to
+    # each page usually finds the file already written. The per-path lock
+    # keeps a concurrent index() request from duplicating the API call.
+    _warm_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="title-warm")
+    _title_locks: dict = {}
+
+    def _title_lock(key: str) -> threading.Lock:
+        with state_lock:
+            lock = _title_locks.get(key)
+            if lock is None:
+                lock = _title_locks.setdefault(key, threading.Lock())
+            return lock
+
+    def _ensure_devotional_titles(img: Path) -> List[str]:
+        fp = repo.subdir_for_image(img) / "titles_devotional.txt"
+        with _title_lock(str(fp)):
+            titles = _read_lines(fp)
+            if not titles:
+                titles = title_service.devotional_titles(img)
+                _persist_titles(fp, titles)
+            return titles
+
+    def _warm_titles() -> None:
+        for img in _ordered_images():
+            if not (repo.subdir_for_image(img) / "titles_devotional.txt").exists():
+                _warm_pool.submit(_warm_one, img)
+
+    def _warm_one(img: Path) -> None:
+        try:
+            _ensure_devotional_titles(img)
+        except Exception as exc:
+            print(f"[WARN] title warmup failed for {img.name}: {exc}")
+
+    def _snapshot_subdir(directory: Path) -> dict:
+        # One scandir covers every per-image file check in index(); each
+        # entry's stat comes back with the listing instead of a syscall per
+        # candidate filename.
+        try:
+            with os.scandir(directory) as it:
+                return {entry.name: entry.stat() for entry in it}
+        except FileNotFoundError:
+            return {}
+
+    # Parsed title files keyed by path; the stat() guard means an unchanged
+    # file costs one syscall per navigation click instead of a full read.
+    _titles_cache: dict = {}
+
+    def _read_lines(path: Path) -> List[str]:
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            _titles_cache.pop(str(path), None)
+            return []
+        cached = _titles_cache.get(str(path))
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        _titles_cache[str(path)] = (mtime_ns, lines)
+        return lines
 
     def _persist_titles(path: Path, titles: List[str]) -> None:
+        _titles_cache.pop(str(path), None)
         path.write_text("\n".join(titles) + "\n", encoding="utf-8")
 
-    def _load_chosen_titles(path: Path) -> List[str]:
-        if path.exists():
-            return [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
-        return []
-
-    def _process_titles(idx: int, img: Path, titles_selected: List[str]) -> str:
-        directory = repo.subdir_for_image(img)
-        joined_titles = "\n".join(titles_selected) + "\n"
-        (directory / "chosen.txt").write_text(joined_titles, encoding="utf-8")
-        (directory / "titre1.txt").write_text(joined_titles, encoding="utf-8")
+    # Per-image track builds run off the request thread; the dict maps the
+    # page index to its Future so /status/<i> can report progress and the
+    # final page can wait before handing off to Resolve.
+    _audio_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tracks")
+    _audio_jobs: dict = {}
 
+    def _build_tracks(img: Path, directory: Path, titles_selected: List[str]) -> None:
         try:
             main_title = titles_selected[0]
             gospels, psalms, combined = title_service.best_references(img, main_title)
@@ -212,7 +381,6 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
             write_refs_lists(directory, [], [], [])
             combined = []
 
-        require_bin("ffprobe")
         ps_items = audio_engine.collect_psalms()
         need_gospels_head = any(isinstance(x, str) for x in (combined or []))
         go_items = []
@@ -240,7 +408,27 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
             offset_first=settings.core.trim_first_audio_seconds,
         )
 
-        msg = f"{len(titles_selected)} title(s) saved. Tracks refreshed for track{idx_num:02d}."
+        sync_signal.set()
+
+    def _process_titles(idx: int, img: Path, titles_selected: List[str]) -> str:
+        directory = repo.subdir_for_image(img)
+        chosen_fp = directory / "chosen.txt"
+        titre_fp = directory / "titre1.txt"
+        chosen_fp.write_bytes("\n".join(titles_selected).encode("utf-8") + b"\n")
+        # titre1.txt is always an exact copy of chosen.txt; hardlink it to
+        # the fresh file instead of writing the same bytes twice.
+        titre_fp.unlink(missing_ok=True)
+        try:
+            os.link(chosen_fp, titre_fp)
+        except OSError:
+            titre_fp.write_bytes(chosen_fp.read_bytes())
+
+        # Titles are on disk; references, selection and file copies continue
+        # in the background so the redirect returns immediately.
+        _audio_jobs[idx] = _audio_pool.submit(_build_tracks, img, directory, titles_selected)
+
+        idx_num = extract_index_from_name(img.name) or 0
+        msg = f"{len(titles_selected)} title(s) saved. Tracks building for track{idx_num:02d}."
         if settings.audio.auto_trigger_resolve:
             msg += " Resolve sync will start when all images are processed."
         return msg
@@ -252,10 +440,9 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
         resolve_script = Path(__file__).resolve().parents[2] / "scripts" / "update_resolve.py"
         if not resolve_script.exists():
             return "missing"
-        if trigger_event.is_set():
+        if not resolve_inflight.acquire(blocking=False):
             return "busy"
 
-        trigger_event.set()
         indices = indices or []
         only_args: List[str] = []
         label = "all"
@@ -266,7 +453,8 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
 
         def _worker():
             try:
-                timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+                # One strftime serves the filename and the start marker.
+                timestamp = time.strftime("%Y%m%d-%H%M%S")
                 log_path = settings.paths.log_dir / f"resolve_{label}_{timestamp}.log"
                 settings.paths.log_dir.mkdir(parents=True, exist_ok=True)
                 cmd = [
@@ -276,23 +464,43 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
                 cmd.extend(only_args)
                 if config_path:
                     cmd.extend(["--config", str(config_path)])
-                with log_path.open("w", encoding="utf-8") as log:
-                    log.write(f"[INFO] Start {datetime.now().isoformat()} | cmd={' '.join(cmd)}\n")
-                    log.flush()
+                # Raw append-mode fd: the child inherits it directly and no
+                # buffered Python file object sits on the log while the
+                # render runs; the two markers are single os.write calls.
+                fd = os.open(str(log_path), os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+                try:
+                    header = f"[INFO] Start {timestamp} | cmd={' '.join(cmd)}\n"
+                    os.write(fd, header.encode("utf-8"))
                     proc = subprocess.Popen(
                         cmd,
-                        stdout=log,
+                        stdout=fd,
                         stderr=subprocess.STDOUT,
                         cwd=resolve_script.parent,
                     )
                     proc.wait()
-                    log.write(f"[INFO] End {datetime.now().isoformat()} (code={proc.returncode})\n")
+                    footer = f"[INFO] End {time.strftime('%Y%m%d-%H%M%S')} (code={proc.returncode})\n"
+                    os.write(fd, footer.encode("utf-8"))
+                finally:
+                    os.close(fd)
             finally:
-                trigger_event.clear()
+                resolve_inflight.release()
 
         threading.Thread(target=_worker, daemon=True).start()
         return "started"
 
+    def _finalize_and_sync() -> None:
+        for job in list(_audio_jobs.values()):
+            try:
+                job.result()
+            # SystemExit included: the audio collectors signal missing
+            # directories with fatal()-style raises, and that must not kill
+            # the finalizer before the remaining builds are drained.
+            except (Exception, SystemExit) as exc:
+                print(f"[WARN] track build failed: {exc}")
+        note = _schedule_resolve_all()
+        if note:
+            print(f"[INFO] {note}")
+
     def _schedule_resolve_all() -> Optional[str]:
         status = _trigger_resolve()
         if status == "started":
@@ -305,22 +513,37 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
             return "Auto Resolve launch disabled."
         return None
 
+    def _invalidate_ordered() -> None:
+        with state_lock:
+            state["ordered"] = []
+            state["mtime"] = 0.0
+
     @app.route("/restart")
     def restart():
         repo.ensure_dirs()
-        state["ordered"] = repo.list_images()
-        if not state["ordered"]:
+        _invalidate_ordered()
+        if not _ordered_images():
             return "No images (.jpg/.jpeg/.png) found in configured folder.", 200
+        _warm_titles()
         return redirect(url_for("index", i=0))
 
     @app.get("/factory_reset")
     def factory_reset():
         repo.hard_reset_state()
         repo.ensure_dirs()
-        state["ordered"] = repo.list_images()
+        _invalidate_ordered()
         flash("Reset done (thumbnails kept).")
         return redirect(url_for("restart"))
 
+    @app.get("/thumb/<int:i>")
+    def thumb(i: int):
+        ordered = _ordered_images()
+        if i < 0 or i >= len(ordered):
+            abort(404)
+        # Conditional send: the browser revalidates with the ETag and gets a
+        # 304 on Prev/Next instead of a fresh base64 copy inlined in the HTML.
+        return send_file(ordered[i], conditional=True, etag=True, max_age=86400)
+
     @app.route("/")
     def index():
         ordered = _ordered_images()
@@ -332,50 +555,52 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
         except ValueError:
             idx = 0
         if idx < 0 or idx >= len(ordered):
-            return render_template_string(DONE_TMPL, image_dir=str(repo.image_dir), resolve_note=None)
+            return done_template.render(image_dir=str(repo.image_dir), resolve_note=None)
 
         img = ordered[idx]
         directory = repo.subdir_for_image(img)
 
-        yt_path, orig_bytes, yt_bytes = repo.ensure_yt_thumbnail(img)
-        data_url = img_to_data_url(img)
-        data_url_yt = img_to_data_url(yt_path) if yt_path else None
+        img_ctx = _image_ctx(img)
+        for j in (idx + 1, idx - 1):
+            _prefetch_queue.put(j)
+
+        snap = _snapshot_subdir(directory)
 
-        titles_devotional_fp = directory / "titles_devotional.txt"
-        titles_devotional = _load_titles(titles_devotional_fp)
+        titles_devotional = _read_lines(directory / "titles_devotional.txt") if "titles_devotional.txt" in snap else []
         if not titles_devotional:
             try:
-                titles_devotional = title_service.devotional_titles(img)
-                _persist_titles(titles_devotional_fp, titles_devotional)
+                titles_devotional = _ensure_devotional_titles(img)
             except Exception as exc:
                 flash(f"Title generation failed: {exc}")
                 titles_devotional = []
 
-        chosen_fp = directory / "chosen.txt"
-        chosen_existing = _load_chosen_titles(chosen_fp)
+        chosen_existing = _read_lines(directory / "chosen.txt") if "chosen.txt" in snap else []
 
         idx_num = extract_index_from_name(img.name) or 0
         track_dir = repo.track_root / f"track{idx_num:02d}"
         chapters_path = repo.track_root / f"chapters{idx_num:02d}.txt"
 
-        return render_template_string(
-            PAGE_TMPL,
-            error=None,
-            idx=idx,
-            total=len(ordered),
-            img_name=img.name,
-            subdir=str(directory),
-            data_url=data_url,
-            data_url_yt=data_url_yt,
-            orig_size_str=human_mb(orig_bytes),
-            yt_size_str=(human_mb(yt_bytes) if yt_bytes is not None else None),
-            yt_path_str=(str(yt_path) if yt_path else None),
-            titles_devotional=titles_devotional,
-            chosen_existing=chosen_existing,
-            prev_i=(idx - 1 if idx > 0 else None),
-            next_i=(idx + 1 if idx + 1 < len(ordered) else None),
-            track_dir=str(track_dir),
-            chapters_path=str(chapters_path),
+        # One dict straight into the compiled render function; no kwargs
+        # repacking and none of Flask's context-processor walk.
+        ctx = {
+            "error": None,
+            "idx": idx,
+            "total": len(ordered),
+            "img_name": img.name,
+            "subdir": str(directory),
+            "titles_devotional": titles_devotional,
+            "chosen_existing": chosen_existing,
+            "prev_i": idx - 1 if idx > 0 else None,
+            "next_i": idx + 1 if idx + 1 < len(ordered) else None,
+            "track_dir": str(track_dir),
+            "chapters_path": str(chapters_path),
+        }
+        ctx.update(img_ctx)
+        # Stream the render: WSGI chunks go out as Jinja produces them, so
+        # long title lists never sit in one big string. The context wrapper
+        # keeps url_for/flashes alive while waitress drains the iterator.
+        return app.response_class(
+            stream_with_context(page_template.stream(ctx)), mimetype="text/html"
         )
 
     @app.post("/regen")
@@ -403,19 +628,16 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
         return redirect(url_for("index", i=idx))
 
     def _titles_selected_from_request() -> List[str]:
-        raw_checked = request.form.getlist("titles")
         raw_custom = request.form.get("custom_titles") or ""
-        custom_titles = [line.strip() for line in raw_custom.splitlines() if line.strip()]
-        merged = raw_checked + custom_titles
-
+        # Single pass over checkboxes then custom lines; no merged list, one
+        # normalize per candidate.
         titles_selected: List[str] = []
         seen = set()
-        for t in merged:
+        for t in (*request.form.getlist("titles"), *raw_custom.splitlines()):
             norm = normalize_title(t)
-            if not norm or norm in seen:
-                continue
-            seen.add(norm)
-            titles_selected.append(t.strip())
+            if norm and norm not in seen:
+                seen.add(norm)
+                titles_selected.append(t.strip())
         return titles_selected
 
     def _handle_titles_for_idx(idx: int, titles_selected: List[str], skip_empty: bool = False):
@@ -440,14 +662,33 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
 
         next_idx = idx + 1
         if next_idx >= len(ordered):
-            resolve_note = _schedule_resolve_all()
-            return render_template_string(
-                DONE_TMPL,
+            pending = sorted(i for i, job in _audio_jobs.items() if not job.done())
+            # Resolve reads the track dirs, so a finalizer thread waits for
+            # every background build before launching the sync; the response
+            # returns immediately and the done page polls /status/<i>.
+            threading.Thread(target=_finalize_and_sync, daemon=True).start()
+            resolve_note = (
+                "Resolve sync will start once the remaining track builds finish."
+                if settings.audio.auto_trigger_resolve
+                else None
+            )
+            return done_template.render(
                 image_dir=str(repo.image_dir),
                 resolve_note=resolve_note,
+                pending=pending,
             )
         return redirect(url_for("index", i=next_idx))
 
+    @app.get("/status/<int:i>")
+    def status(i: int):
+        job = _audio_jobs.get(i)
+        if job is None:
+            return {"status": "idle"}
+        if not job.done():
+            return {"status": "running"}
+        exc = job.exception()
+        return {"status": f"error: {exc}"} if exc else {"status": "done"}
+
     @app.post("/choose")
     def choose():
         try:
@@ -470,7 +711,7 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
             abort(400)
         img = ordered[idx]
         directory = repo.subdir_for_image(img)
-        chosen_existing = _load_chosen_titles(directory / "chosen.txt")
+        chosen_existing = _read_lines(directory / "chosen.txt")
         return _handle_titles_for_idx(idx, chosen_existing, skip_empty=True)
 
     @app.post("/skip")
@@ -484,7 +725,7 @@ def create_app(settings: Settings, config_path: Optional[Path] = None) -> Flask:
             abort(400)
         next_idx = idx + 1
         if next_idx >= len(ordered):
-            return render_template_string(DONE_TMPL, image_dir=str(repo.image_dir), resolve_note=None)
+            return done_template.render(image_dir=str(repo.image_dir), resolve_note=None)
         return redirect(url_for("index", i=next_idx))
 
     return app